@@ -2,12 +2,11 @@
 from datetime import datetime
 from decimal import Decimal
 
+import numpy as np
 from pydantic import BaseModel
 
-from uniswap_v3_backtester.algo.math import (
-    compute_impermanent_loss,
-    compute_realized_il,
-)
+from uniswap_v3_backtester.algo import _fast
+from uniswap_v3_backtester.algo._kernels import compute_il_from_ratios
 
 
 class ILTimeseries(BaseModel):
@@ -33,25 +32,48 @@ class ImpermanentLossTracker:
 
         self.tick_lower = tick_lower
         self.tick_upper = tick_upper
+        self._sqrt_k_min, self._inv_sqrt_k_max = _fast.impermanent_loss_invariants(
+            entry_tick, tick_lower, tick_upper
+        )
 
-        self.il_series: list[tuple[datetime, Decimal]] = []
-        self.realized_il_series: list[tuple[datetime, Decimal]] = []
+        # Ticks are buffered per swap and converted to IL in one batch on read
+        self._il_ts: list[datetime] = []
+        self._ticks: list[int] = []
+        self._il_values: np.ndarray = np.empty(0)
+        self._realized_ts: list[datetime] = []
+        self._realized_vals: list[float] = []
 
     def track_il(self, timestamp: datetime, current_tick: int) -> None:
-        if current_tick < self.tick_lower:
-            clamped_tick = self.tick_lower
-        elif current_tick > self.tick_upper:
-            clamped_tick = self.tick_upper
-        else:
-            clamped_tick = current_tick
-
-        il = compute_impermanent_loss(
-            current_tick=clamped_tick,
-            entry_tick=self.entry_tick,
-            min_tick=self.tick_lower,
-            max_tick=self.tick_upper,
+        self._il_ts.append(timestamp)
+        self._ticks.append(current_tick)
+
+    def track_il_batch(
+        self, timestamps: list[datetime], ticks: np.ndarray, il: np.ndarray | None = None
+    ) -> None:
+        """Buffer a block of ticks, optionally with their already computed IL values."""
+        cached = len(self._il_values) == len(self._ticks)
+        self._il_ts.extend(timestamps)
+        self._ticks.extend(ticks.tolist())
+        if il is not None and cached:
+            self._il_values = np.concatenate([self._il_values, il])
+
+    def _compute_il_values(self) -> np.ndarray:
+        if len(self._il_values) != len(self._ticks):
+            clamped_ticks = np.clip(
+                np.asarray(self._ticks, dtype=np.int64), self.tick_lower, self.tick_upper
+            )
+            self._il_values = compute_il_from_ratios(
+                clamped_ticks / self.entry_tick, self._sqrt_k_min, self._inv_sqrt_k_max
+            )
+        return self._il_values
+
+    def _last_il(self) -> float:
+        if not self._ticks:
+            return 0.0
+        clamped_tick = min(max(self._ticks[-1], self.tick_lower), self.tick_upper)
+        return _fast.impermanent_loss_from_ratio(
+            clamped_tick / self.entry_tick, self._sqrt_k_min, self._inv_sqrt_k_max
         )
-        self.il_series.append((timestamp, il))
 
     def realize_il(
         self, timestamp: datetime, new_token0: Decimal, new_token1: Decimal
@@ -62,23 +84,25 @@ class ImpermanentLossTracker:
             else Decimal("0.5")
         )
         target_ratio = self.entry_token0_ratio
-        full_il = self.il_series[-1][1] if self.il_series else Decimal("0")
+        full_il = self._last_il()
 
-        realized = compute_realized_il(
-            entry_token0_ratio=self.entry_token0_ratio,
-            current_token0_ratio=current_ratio,
-            target_token0_ratio=target_ratio,
+        realized = _fast.compute_realized_il(
+            entry_token0_ratio=float(self.entry_token0_ratio),
+            current_token0_ratio=float(current_ratio),
+            target_token0_ratio=float(target_ratio),
             full_il=full_il,
         )
-        self.realized_il_series.append((timestamp, realized))
+        self._realized_ts.append(timestamp)
+        self._realized_vals.append(realized)
 
     def get_il_series(self) -> ILTimeseries:
-        ts, values = zip(*self.il_series) if self.il_series else ([], [])
-        return ILTimeseries(timestamps=list(ts), values=list(values))
+        values = self._compute_il_values().tolist()
+        return ILTimeseries.model_construct(
+            timestamps=list(self._il_ts), values=[Decimal(v) for v in values]
+        )
 
     def get_realized_il_series(self) -> ILTimeseries:
-        ts, values = (
-            zip(*self.realized_il_series) if self.realized_il_series else ([], [])
+        return ILTimeseries.model_construct(
+            timestamps=list(self._realized_ts),
+            values=[Decimal(v) for v in self._realized_vals],
         )
-        return ILTimeseries(timestamps=list(ts), values=list(values))
-
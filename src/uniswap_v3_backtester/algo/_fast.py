@@ -0,0 +1,49 @@
+"""
+float64 counterparts of the Decimal formulas in ``algo.math``, used
+internally on the per-swap hot path. Results are converted to Decimal once,
+when a timeseries or total is read back.
+"""
+
+import math
+
+
+def impermanent_loss_invariants(
+    entry_tick: int, min_tick: int, max_tick: int
+) -> tuple[float, float]:
+    """sqrt(k_min) and 1 / sqrt(k_max), which only depend on the position."""
+    return math.sqrt(min_tick / entry_tick), 1 / math.sqrt(max_tick / entry_tick)
+
+
+def impermanent_loss_from_ratio(
+    k: float, sqrt_k_min: float, inv_sqrt_k_max: float
+) -> float:
+    one_plus_k = 1 + k
+    il_base = (2 * math.sqrt(k) / one_plus_k) - 1
+    factor = 1 / (1 - ((sqrt_k_min + k * inv_sqrt_k_max) / one_plus_k))
+    return il_base * factor * 100
+
+
+def compute_impermanent_loss(
+    current_tick: int, entry_tick: int, min_tick: int, max_tick: int
+) -> float:
+    sqrt_k_min, inv_sqrt_k_max = impermanent_loss_invariants(
+        entry_tick, min_tick, max_tick
+    )
+    return impermanent_loss_from_ratio(
+        current_tick / entry_tick, sqrt_k_min, inv_sqrt_k_max
+    )
+
+
+def compute_realized_il(
+    entry_token0_ratio: float,
+    current_token0_ratio: float,
+    target_token0_ratio: float,
+    full_il: float,
+) -> float:
+    if target_token0_ratio == current_token0_ratio:
+        return 0.0
+    denominator = abs(entry_token0_ratio - current_token0_ratio)
+    if denominator == 0:
+        return 0.0
+    realization_fraction = abs(target_token0_ratio - current_token0_ratio) / denominator
+    return realization_fraction * full_il * 100
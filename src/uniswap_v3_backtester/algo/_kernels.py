@@ -0,0 +1,143 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from uniswap_v3_backtester.algo._fast import impermanent_loss_invariants
+from uniswap_v3_backtester.algo.math import tick_to_sqrt_price, ticks_to_sqrt_prices
+
+
+def compute_activity(ticks: np.ndarray, tick_lower: int, tick_upper: int) -> np.ndarray:
+    return (ticks >= tick_lower) & (ticks <= tick_upper)
+
+
+def compute_token_amounts(
+    ticks: np.ndarray, tick_lower: int, tick_upper: int, liquidity: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of compute_token_amounts_from_liquidity.
+
+    Clamping the current sqrt price to the position bounds collapses the
+    below/in/above range branches into a single expression.
+    """
+    sqrt_price_lower = tick_to_sqrt_price(tick_lower)
+    sqrt_price_upper = tick_to_sqrt_price(tick_upper)
+    sqrt_price = np.clip(
+        ticks_to_sqrt_prices(ticks), sqrt_price_lower, sqrt_price_upper
+    )
+
+    amount0 = liquidity * (1 / sqrt_price - 1 / sqrt_price_upper)
+    amount1 = liquidity * (sqrt_price - sqrt_price_lower)
+    return amount0, amount1
+
+
+def compute_fees(
+    volumes0: np.ndarray,
+    volumes1: np.ndarray,
+    liquidity: np.ndarray,
+    position_liquidity: float,
+    pool_fee: float,
+    is_active: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array version of FeeCalculator.compute_fee_for_swap, zeroed where inactive."""
+    liq_share = position_liquidity / (liquidity + position_liquidity)
+
+    fee0 = np.where(
+        is_active & (volumes0 > 0) & (volumes1 < 0),
+        liq_share * (volumes0 * pool_fee),
+        0.0,
+    )
+    fee1 = np.where(
+        is_active & (volumes1 > 0) & (volumes0 < 0),
+        liq_share * (volumes1 * pool_fee),
+        0.0,
+    )
+    return fee0, fee1
+
+
+def compute_il_batch(
+    ticks: np.ndarray, entry_tick: int, min_tick: int, max_tick: int
+) -> np.ndarray:
+    """Array version of compute_impermanent_loss."""
+    sqrt_k_min, inv_sqrt_k_max = impermanent_loss_invariants(
+        entry_tick, min_tick, max_tick
+    )
+    return compute_il_from_ratios(ticks / entry_tick, sqrt_k_min, inv_sqrt_k_max)
+
+
+def compute_il_from_ratios(
+    k: np.ndarray, sqrt_k_min: float, inv_sqrt_k_max: float
+) -> np.ndarray:
+    """IL for price ratios k = tick / entry_tick, given the position invariants."""
+    one_plus_k = 1 + k
+    il_base = 2 * np.sqrt(k)
+    il_base /= one_plus_k
+    il_base -= 1
+    factor = k * inv_sqrt_k_max
+    factor += sqrt_k_min
+    factor /= one_plus_k
+    np.subtract(1, factor, out=factor)
+    return il_base / factor * 100
+
+
+class SeriesResult(NamedTuple):
+    is_active: np.ndarray
+    amount0: np.ndarray
+    amount1: np.ndarray
+    fee0: np.ndarray
+    fee1: np.ndarray
+    il: np.ndarray | None
+
+
+def run_vectorized(
+    arrays: dict[str, np.ndarray],
+    tick_lower: int,
+    tick_upper: int,
+    liquidity: float,
+    pool_fee: float,
+    il_range: tuple[int, int, int] | None = None,
+) -> SeriesResult:
+    """
+    Activity, token amounts, fees and (optionally) IL for a whole swap series
+    with fixed position bounds, in one pass over the SoA columns.
+
+    The sqrt price gather and the range masks are computed once and shared;
+    intermediate results are written in place into the output buffers.
+    ``il_range`` is ``(entry_tick, min_tick, max_tick)`` of the IL tracker.
+    """
+    ticks = arrays["ticks"]
+    volumes0 = arrays["volumes0"]
+    volumes1 = arrays["volumes1"]
+
+    is_active = ticks >= tick_lower
+    np.logical_and(is_active, ticks <= tick_upper, out=is_active)
+
+    sqrt_price_lower = tick_to_sqrt_price(tick_lower)
+    sqrt_price_upper = tick_to_sqrt_price(tick_upper)
+    sqrt_price = ticks_to_sqrt_prices(ticks)
+    np.clip(sqrt_price, sqrt_price_lower, sqrt_price_upper, out=sqrt_price)
+
+    amount0 = np.divide(1, sqrt_price)
+    amount0 -= 1 / sqrt_price_upper
+    amount0 *= liquidity
+    amount1 = np.subtract(sqrt_price, sqrt_price_lower)
+    amount1 *= liquidity
+
+    # sqrt_price is no longer needed, reuse it for the liquidity share
+    liq_share = np.add(arrays["liquidity"], liquidity, out=sqrt_price)
+    np.divide(liquidity, liq_share, out=liq_share)
+
+    fee0 = np.multiply(volumes0, pool_fee)
+    fee0 *= liq_share
+    np.copyto(fee0, 0.0, where=~(is_active & (volumes0 > 0) & (volumes1 < 0)))
+    fee1 = np.multiply(volumes1, pool_fee)
+    fee1 *= liq_share
+    np.copyto(fee1, 0.0, where=~(is_active & (volumes1 > 0) & (volumes0 < 0)))
+
+    il = None
+    if il_range is not None:
+        entry_tick, min_tick, max_tick = il_range
+        il = compute_il_batch(
+            np.clip(ticks, min_tick, max_tick), entry_tick, min_tick, max_tick
+        )
+
+    return SeriesResult(is_active, amount0, amount1, fee0, fee1, il)
@@ -2,10 +2,15 @@
 from datetime import datetime
 from decimal import Decimal
 
+import numpy as np
 from pydantic import BaseModel
 
-from uniswap_v3_backtester.algo.math import compute_token_amounts_from_liquidity
-from uniswap_v3_backtester.algo.pool import Position, Swap
+from uniswap_v3_backtester.algo._kernels import compute_activity, compute_token_amounts
+from uniswap_v3_backtester.algo.math import (
+    compute_token_amounts_from_sqrt_prices,
+    tick_to_sqrt_price,
+)
+from uniswap_v3_backtester.algo.pool import Position, Swap, SwapSeries
 
 
 class ActivityTimeseries(BaseModel):
@@ -23,24 +28,62 @@ class ActivityTracker(BaseModel):
     def is_active(self, tick: int) -> bool:
         return self.position.tick_lower <= tick <= self.position.tick_upper
 
-    def track(self, swap: Swap) -> None:
+    def track(self, swap: Swap) -> bool:
+        position = self.position
         active = self.is_active(swap.tick)
-        amount0, amount1 = compute_token_amounts_from_liquidity(
-            self.position.tick_lower,
-            self.position.tick_upper,
-            self.position.liquidity,
-            swap.tick,
+        amount0, amount1 = compute_token_amounts_from_sqrt_prices(
+            float(position.liquidity),
+            tick_to_sqrt_price(swap.tick),
+            position.sqrt_price_lower,
+            position.sqrt_price_upper,
+            position.inv_sqrt_price_upper,
         )
-        self.position.amount0 = amount0
-        self.position.amount1 = amount1
+        amount0, amount1 = Decimal(amount0), Decimal(amount1)
+        position.amount0 = amount0
+        position.amount1 = amount1
 
         self.amounts_token0.append(amount0)
         self.amounts_token1.append(amount1)
         self.timestamps.append(swap.timestamp)
         self.activity.append(active)
+        return active
+
+    def track_batch(self, timestamps: list[datetime], ticks: np.ndarray) -> np.ndarray:
+        """Vectorized track over swaps sharing the current position bounds."""
+        tick_lower = self.position.tick_lower
+        tick_upper = self.position.tick_upper
+        active = compute_activity(ticks, tick_lower, tick_upper)
+        amounts0, amounts1 = compute_token_amounts(
+            ticks, tick_lower, tick_upper, float(self.position.liquidity)
+        )
+        self.record_batch(timestamps, active, amounts0, amounts1)
+        return active
+
+    def track_series(self, swap_series: SwapSeries) -> np.ndarray:
+        """Track a whole series whose swaps all see the current position bounds."""
+        return self.track_batch(swap_series.timestamps, swap_series.to_arrays()["ticks"])
+
+    def record_batch(
+        self,
+        timestamps: list[datetime],
+        active: np.ndarray,
+        amounts0: np.ndarray,
+        amounts1: np.ndarray,
+    ) -> None:
+        """Append precomputed activity and token amounts for a block of swaps."""
+        amounts0 = [Decimal(a) for a in amounts0.tolist()]
+        amounts1 = [Decimal(a) for a in amounts1.tolist()]
+        if timestamps:
+            self.position.amount0 = amounts0[-1]
+            self.position.amount1 = amounts1[-1]
+
+        self.amounts_token0.extend(amounts0)
+        self.amounts_token1.extend(amounts1)
+        self.timestamps.extend(timestamps)
+        self.activity.extend(active.tolist())
 
     def get_timeseries(self) -> ActivityTimeseries:
-        return ActivityTimeseries(
-            timestamps=self.timestamps,
-            activity=self.activity,
+        return ActivityTimeseries.model_construct(
+            timestamps=list(self.timestamps),
+            activity=list(self.activity),
         )
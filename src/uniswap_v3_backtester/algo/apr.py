@@ -1,10 +1,12 @@
+from bisect import bisect_left
 from datetime import datetime
-from decimal import Decimal, getcontext
+from decimal import Decimal, DivisionByZero, getcontext
 from typing import Dict, List, Tuple
 
+import numpy as np
 from pydantic import BaseModel
 
-from uniswap_v3_backtester.algo.math import sqrtPriceX96_to_price_adjusted
+from uniswap_v3_backtester.algo.math import sqrtPriceX96_to_price
 
 getcontext().prec = 40  # High precision
 
@@ -27,9 +29,14 @@ class APRTracker:
         self.initial_tick = initial_tick
         self.token0_decimals = token0_decimals
         self.token1_decimals = token1_decimals
+        self._decimal_adjustment = Decimal(10) ** (token0_decimals - token1_decimals)
 
         self.start_date: datetime | None = None
-        self.end_states_by_day: Dict[datetime, Tuple[Decimal, Decimal, Decimal, Decimal, int]] = {}
+        # (token0, token1, fee0, fee1, price_token1_per_token0), all scaled
+        self.end_states_by_day: Dict[datetime, Tuple[Decimal, Decimal, Decimal, Decimal, Decimal]] = {}
+        self._sorted_days: List[datetime] = []
+        self._current_day: datetime | None = None
+        self._pending_state: Tuple[Decimal, Decimal, Decimal, Decimal, int] | None = None
 
     def _scale(self, amount: Decimal, decimals: int) -> Decimal:
         return amount / Decimal(10 ** decimals)
@@ -45,57 +52,59 @@ class APRTracker:
         sqrtPriceX96: int,
     ) -> None:
         day = datetime(timestamp.year, timestamp.month, timestamp.day)
-        if self.start_date is None:
-            self.start_date = day
-
+        if day != self._current_day:
+            self._flush_day()
+            if self.start_date is None:
+                self.start_date = day
+            self._current_day = day
+
+        # Only the last state of a day is kept, so scaling waits for the day to close
+        self._pending_state = (token0, token1, fee_token0, fee_token1, sqrtPriceX96)
+
+    def _flush_day(self) -> None:
+        if self._pending_state is None:
+            return
+        token0, token1, fee_token0, fee_token1, sqrtPriceX96 = self._pending_state
         t0 = self._scale(token0, self.token0_decimals)
         t1 = self._scale(token1, self.token1_decimals)
         f0 = self._scale(fee_token0, self.token0_decimals)
         f1 = self._scale(fee_token1, self.token1_decimals)
-        self.end_states_by_day[day] = (t0, t1, f0, f1, sqrtPriceX96)
+        day = self._current_day
+        if day not in self.end_states_by_day:
+            self._sorted_days.insert(bisect_left(self._sorted_days, day), day)
+        price = sqrtPriceX96_to_price(sqrtPriceX96) * self._decimal_adjustment
+        self.end_states_by_day[day] = (t0, t1, f0, f1, price)
+        self._pending_state = None
 
     def compute_apr_on_dates(self, query_dates: List[datetime]) -> APRTimeseries:
         if self.start_date is None:
-            return APRTimeseries(dates=[], aprs=[])
-
-        aprs = []
-        dates = []
-
-        for query_date in query_dates:
-            if query_date <= self.start_date:
-                continue
-
-            valid_days = [d for d in self.end_states_by_day.keys() if d <= query_date]
-            if not valid_days:
-                continue
-
-            last_day = max(valid_days)
-            token0, token1, fee0, fee1, sqrtPriceX96 = self.end_states_by_day[last_day]
-
-            # Adjusted price (token1 per token0)
-            price_token1_per_token0 = sqrtPriceX96_to_price_adjusted(
-                sqrtPriceX96,
-                token0_decimals=self.token0_decimals,
-                token1_decimals=self.token1_decimals
-            )
-
-            # LP value in token1
-            total_token0 = token0 + fee0
-            total_token1 = token1 + fee1
-            token0_value_in_token1 = total_token0 * price_token1_per_token0
-            lp_value_token1 = total_token1 + token0_value_in_token1
-
-            # HODL benchmark
-            initial_token0_value_in_token1 = self.initial_token0_scaled * price_token1_per_token0
-            hodl_value_token1 = self.initial_token1_scaled + initial_token0_value_in_token1
-
-            # APR calculation
-            net_gain = lp_value_token1 - hodl_value_token1
-            days_elapsed = (query_date - self.start_date).days
-            if days_elapsed < 1:
-                continue
-            apr = (net_gain / hodl_value_token1) * 100
-            dates.append(query_date)
-            aprs.append(apr)
-
-        return APRTimeseries(dates=dates, aprs=aprs)
+            return APRTimeseries.model_construct(dates=[], aprs=[])
+        self._flush_day()
+
+        dates = [d for d in query_dates if (d - self.start_date).days >= 1]
+        if not dates:
+            return APRTimeseries.model_construct(dates=[], aprs=[])
+
+        days = np.array(self._sorted_days, dtype="datetime64[us]")
+        idx = np.searchsorted(days, np.array(dates, dtype="datetime64[us]"), side="right") - 1
+        states = np.array(
+            [self.end_states_by_day[d] for d in self._sorted_days], dtype=np.float64
+        )
+
+        # Last stored day on or before each query date
+        token0, token1, fee0, fee1, price_token1_per_token0 = states[idx].T
+
+        # LP value in token1
+        lp_value_token1 = (token1 + fee1) + (token0 + fee0) * price_token1_per_token0
+
+        # HODL benchmark
+        hodl_value_token1 = (
+            float(self.initial_token1_scaled)
+            + float(self.initial_token0_scaled) * price_token1_per_token0
+        )
+
+        # APR calculation; a worthless HODL benchmark raises, as Decimal division did
+        if not hodl_value_token1.all():
+            raise DivisionByZero("HODL value is zero, APR is undefined")
+        aprs = (lp_value_token1 - hodl_value_token1) / hodl_value_token1 * 100
+        return APRTimeseries.model_construct(dates=dates, aprs=[Decimal(a) for a in aprs.tolist()])
@@ -2,8 +2,10 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Tuple
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict
 
+from uniswap_v3_backtester.algo._kernels import run_vectorized
 from uniswap_v3_backtester.algo.activity import ActivityTimeseries, ActivityTracker
 from uniswap_v3_backtester.algo.apr import APRTimeseries, APRTracker
 from uniswap_v3_backtester.algo.fees import FeeCalculator, FeeTimeseries
@@ -17,9 +19,15 @@ from uniswap_v3_backtester.algo.rebalancer import (
     RebalanceEvent,
     RebalancerContext,
     RebalancingStrategy,
+    rebalance_triggers,
 )
 
 
+# Bounds, in swaps, of the window a rebalance trigger mask is evaluated over
+MIN_TRIGGER_WINDOW = 64
+MAX_TRIGGER_WINDOW = 65536
+
+
 class PositionSimulationContext(BaseModel):
     position: Position
     created_at: datetime
@@ -57,14 +65,16 @@ class BacktestResult(BaseModel):
         token_composition: List[Tuple[datetime, Decimal, Decimal]],
         rebalancing_events: List[RebalanceEvent]
     ):
-        return cls(
-            total_fees_token0=context.calculator.get_total_fees().token0,
-            total_fees_token1=context.calculator.get_total_fees().token1,
+        total_fees = context.calculator.get_total_fees()
+        # Everything here comes from the trackers already typed, skip revalidation
+        return cls.model_construct(
+            total_fees_token0=total_fees.token0,
+            total_fees_token1=total_fees.token1,
             apr_series=apr_series,
             activity_series=context.tracker.get_timeseries(),
             fee_series=context.calculator.get_timeseries(),
-            il_series=context.il_tracker.get_il_series() if context.il_tracker else ILTimeseries(timestamps=[], values=[]),
-            realized_il=context.il_tracker.get_realized_il_series() if context.il_tracker else ILTimeseries(timestamps=[], values=[]),
+            il_series=context.il_tracker.get_il_series() if context.il_tracker else ILTimeseries.model_construct(timestamps=[], values=[]),
+            realized_il=context.il_tracker.get_realized_il_series() if context.il_tracker else ILTimeseries.model_construct(timestamps=[], values=[]),
             token_balance_series=token_balances,
             token_composition_series=token_composition,
             swap_ticks=[(swap.timestamp, swap.tick) for swap in context.swap_series.swaps],
@@ -89,14 +99,137 @@ class GlobalClockBacktestRunner:
         self.rebalance_events = [[] for _ in contexts]
 
     def run(self) -> BacktestOutput:
+        stepped = []
+        for i, context in enumerate(self.contexts):
+            swaps, arrays = self._ordered_swaps(context.swap_series)
+            if context.rebalancer is None:
+                # Position bounds never move, so the whole series is one batch
+                self._process_series(i, context, swaps, arrays)
+            else:
+                stepped.append((i, context, swaps, arrays))
+
+        # One cursor per context: each swap is visited exactly once while
+        # walking the global clock. Rebalance checks only run on swaps the
+        # strategy's trigger mask flags. The mask covers a window of swaps that
+        # doubles while no rebalance happens and restarts small after one, so
+        # frequent rebalances do not rescan the rest of the series each time.
+        cursors = [0] * len(stepped)
+        triggers = [
+            (0, self._rebalance_triggers(ctx, arrays, 0, MIN_TRIGGER_WINDOW))
+            for _, ctx, _, arrays in stepped
+        ]
         for t in self.global_timestamps:
-            for i, context in enumerate(self.contexts):
-                swaps_at_t = [s for s in context.swap_series.swaps if s.timestamp == t]
-                for swap in swaps_at_t:
-                    self._process_swap(i, context, swap, t)
+            for slot, (i, context, swaps, arrays) in enumerate(stepped):
+                idx = cursors[slot]
+                start, mask = triggers[slot]
+                while idx < len(swaps) and swaps[idx].timestamp == t:
+                    if idx - start == len(mask):
+                        window = min(2 * len(mask), MAX_TRIGGER_WINDOW)
+                        start, mask = idx, self._rebalance_triggers(context, arrays, idx, window)
+                    if self._process_swap(i, context, swaps[idx], t, bool(mask[idx - start])):
+                        start = idx + 1
+                        mask = self._rebalance_triggers(context, arrays, start, MIN_TRIGGER_WINDOW)
+                    idx += 1
+                cursors[slot] = idx
+                triggers[slot] = (start, mask)
         return self._finalize_results()
 
-    def _process_swap(self, i: int, context: PositionSimulationContext, swap: Swap, timestamp: datetime):
+    @staticmethod
+    def _rebalance_triggers(
+        context: PositionSimulationContext,
+        arrays: dict[str, np.ndarray],
+        start: int,
+        window: int,
+    ) -> np.ndarray:
+        end = start + window
+        return rebalance_triggers(
+            context.rebalancer,
+            arrays["ticks"][start:end],
+            arrays["timestamps_ns"][start:end],
+            context.position.tick_lower,
+            context.position.tick_upper,
+            context.created_at,
+        )
+
+    @staticmethod
+    def _ordered_swaps(swap_series: SwapSeries) -> tuple[List[Swap], dict[str, np.ndarray]]:
+        arrays = swap_series.to_arrays()
+        order = np.argsort(arrays["timestamps_ns"], kind="stable")
+        swaps = [swap_series.swaps[j] for j in order]
+        return swaps, {name: column[order] for name, column in arrays.items()}
+
+    def _process_series(
+        self,
+        i: int,
+        context: PositionSimulationContext,
+        swaps: List[Swap],
+        arrays: dict[str, np.ndarray],
+    ):
+        position = context.position
+        calculator = context.calculator
+        il_tracker = context.il_tracker
+        apr_tracker = context.apr_tracker
+
+        timestamps = [swap.timestamp for swap in swaps]
+        first = len(context.tracker.amounts_token0)
+        initial_amount0, initial_amount1 = position.amount0, position.amount1
+        prior_fees = calculator.get_total_fees()
+        prior_fee0, prior_fee1 = float(prior_fees.token0), float(prior_fees.token1)
+
+        series = run_vectorized(
+            arrays,
+            tick_lower=position.tick_lower,
+            tick_upper=position.tick_upper,
+            liquidity=float(position.liquidity),
+            pool_fee=float(position.pool.fee),
+            il_range=(
+                (il_tracker.entry_tick, il_tracker.tick_lower, il_tracker.tick_upper)
+                if il_tracker
+                else None
+            ),
+        )
+        fee0, fee1 = series.fee0, series.fee1
+
+        context.tracker.record_batch(timestamps, series.is_active, series.amount0, series.amount1)
+        amounts0 = context.tracker.amounts_token0[first:]
+        amounts1 = context.tracker.amounts_token1[first:]
+        calculator.record_batch(timestamps, fee0, fee1)
+
+        self.token_compositions[i].extend(
+            zip(timestamps, [initial_amount0, *amounts0[:-1]], [initial_amount1, *amounts1[:-1]])
+        )
+
+        if il_tracker:
+            il_tracker.track_il_batch(timestamps, arrays["ticks"], series.il)
+
+        self.tick_contexts[i].update(zip(timestamps, arrays["ticks"].tolist()))
+
+        if apr_tracker and swaps:
+            # The APR tracker keeps one state per day, so only day ends matter
+            days = arrays["timestamps_ns"].astype("datetime64[D]")
+            day_ends = [*np.flatnonzero(days[1:] != days[:-1]).tolist(), len(swaps) - 1]
+            cumulative_fee0 = prior_fee0 + np.cumsum(fee0)
+            cumulative_fee1 = prior_fee1 + np.cumsum(fee1)
+            for k in day_ends:
+                apr_tracker.track(
+                    timestamp=swaps[k].timestamp,
+                    token0=amounts0[k],
+                    token1=amounts1[k],
+                    fee_token0=Decimal(cumulative_fee0[k]),
+                    fee_token1=Decimal(cumulative_fee1[k]),
+                    sqrtPriceX96=swaps[k].sqrt_price_x96
+                )
+
+        self.token_balances[i].extend(zip(timestamps, amounts0, amounts1))
+
+    def _process_swap(
+        self,
+        i: int,
+        context: PositionSimulationContext,
+        swap: Swap,
+        timestamp: datetime,
+        check_rebalance: bool = True,
+    ) -> bool:
         position = context.position
         tracker = context.tracker
         calculator = context.calculator
@@ -105,28 +238,30 @@ class GlobalClockBacktestRunner:
 
         self.token_compositions[i].append((timestamp, position.amount0, position.amount1))
 
-        tracker.track(swap)
+        is_active = tracker.track(swap)
 
         rebalancer = context.rebalancer
+        rebalanced = False
 
-        if rebalancer:
+        if rebalancer and check_rebalance:
             rebalance_context = RebalancerContext(
                 tick=swap.tick,
                 timestamp=timestamp,
                 tick_lower=position.tick_lower,
                 tick_upper=position.tick_upper,
-                created_at=context.created_at
+                created_at=context.created_at,
             )
 
             if rebalancer.should_rebalance(rebalance_context):
-                new_lower, new_upper = rebalancer.rebalance(rebalance_context, bias=0.5)
+                rebalanced = True
+                new_lower, new_upper = rebalancer.rebalance(rebalance_context)
                 # Recompute position
                 L, new_amount1 = compute_token1_for_fixed_token0(position.amount0, new_lower, new_upper, swap.tick)
 
                 # Replace the position
-                position.tick_lower = new_lower
-                position.tick_upper = new_upper
+                position.set_bounds(new_lower, new_upper)
                 position.amount1 = new_amount1
+                calculator.reset()
                 rebalance_event = rebalancer.get_event_at(timestamp)
 
                 if context.apr_tracker:
@@ -140,7 +275,9 @@ class GlobalClockBacktestRunner:
                 if rebalance_event:
                     self.rebalance_events[i].append(rebalance_event)
 
-        is_active = tracker.is_active(swap.tick)
+                # Fees for this swap follow the new bounds
+                is_active = tracker.is_active(swap.tick)
+
         calculator.track(swap, is_active)
         if il_tracker:
             il_tracker.track_il(timestamp, swap.tick)
@@ -148,28 +285,30 @@ class GlobalClockBacktestRunner:
         self.tick_contexts[i][timestamp] = swap.tick
 
         if apr_tracker:
+            total_fees = calculator.get_total_fees()
             apr_tracker.track(
                 timestamp=swap.timestamp,
                 token0=position.amount0,
                 token1=position.amount1,
-                fee_token0=calculator.get_total_fees().token0,
-                fee_token1=calculator.get_total_fees().token1,
+                fee_token0=total_fees.token0,
+                fee_token1=total_fees.token1,
                 sqrtPriceX96=swap.sqrt_price_x96
             )
 
         self.token_balances[i].append((timestamp, position.amount0, position.amount1))
+        return rebalanced
 
     def _finalize_results(self) -> BacktestOutput:
         results = []
+        daily_dates = sorted({datetime(ts.year, ts.month, ts.day) for ts in self.global_timestamps})
 
         for i, context in enumerate(self.contexts):
             apr_tracker = context.apr_tracker
 
             if apr_tracker:
-                daily_dates = sorted({datetime(ts.year, ts.month, ts.day) for ts in self.global_timestamps})
                 apr_series = apr_tracker.compute_apr_on_dates(daily_dates)
             else:
-                apr_series = APRTimeseries(dates=[], aprs=[])
+                apr_series = APRTimeseries.model_construct(dates=[], aprs=[])
 
             results.append(
                 BacktestResult.from_simulation(
@@ -181,4 +320,4 @@ class GlobalClockBacktestRunner:
                 )
             )
 
-        return BacktestOutput(results=results)
+        return BacktestOutput.model_construct(results=results)
@@ -1,7 +1,8 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import List
+from typing import Dict, List
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -20,7 +21,8 @@ class CompoundEvent(BaseModel):
     added_token1: Decimal
 
 
-class CompounderContext(BaseModel):
+@dataclass(slots=True)
+class CompounderContext:
     timestamp: datetime
     created_at: datetime
     accumulated_fees: Fee
@@ -55,6 +57,9 @@ class Compounder(BaseModel):
     last_compounded: datetime | None = None
 
     _compound_events: List[CompoundEvent] = []
+    _events_by_ts: Dict[datetime, CompoundEvent] = {}
+    _total_token0: Decimal = Decimal("0")
+    _total_token1: Decimal = Decimal("0")
 
     @field_validator("interval")
     @classmethod
@@ -81,27 +86,20 @@ class Compounder(BaseModel):
     ) -> None:
         position.amount0 += fees.token0
         position.amount1 += fees.token1
-        self._compound_events.append(
-            CompoundEvent(
-                timestamp=context.timestamp,
-                added_token0=fees.token0,
-                added_token1=fees.token1,
-            )
+        event = CompoundEvent(
+            timestamp=context.timestamp,
+            added_token0=fees.token0,
+            added_token1=fees.token1,
         )
+        self._compound_events.append(event)
+        self._events_by_ts.setdefault(event.timestamp, event)
+        self._total_token0 += fees.token0
+        self._total_token1 += fees.token1
         context.accumulated_fees = Fee(token0=Decimal(0), token1=Decimal(0))
         self.last_compounded = context.timestamp
 
     def get_event_at(self, timestamp: datetime) -> CompoundEvent | None:
-        for event in self._compound_events:
-            if event.timestamp == timestamp:
-                return event
-        return None
+        return self._events_by_ts.get(timestamp)
 
     def get_total_compounded_fees(self) -> Fee:
-        total_token0 = sum(
-            (e.added_token0 for e in self._compound_events), start=Decimal("0")
-        )
-        total_token1 = sum(
-            (e.added_token1 for e in self._compound_events), start=Decimal("0")
-        )
-        return Fee(token0=total_token0, token1=total_token1)
+        return Fee(token0=self._total_token0, token1=self._total_token1)
@@ -1,14 +1,19 @@
 
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, PrivateAttr
 
-from uniswap_v3_backtester.algo.pool import Position, Swap
+from uniswap_v3_backtester.algo._kernels import compute_activity, compute_fees
+from uniswap_v3_backtester.algo.pool import Position, Swap, SwapSeries
 
 
-class Fee(BaseModel):
+@dataclass(slots=True)
+class Fee:
     token0: Decimal
     token1: Decimal
 
@@ -21,8 +26,21 @@ class FeeTimeseries(BaseModel):
 class FeeCalculator(BaseModel):
     position: Position
     _timestamps: list[datetime] = []
-    _fees: list[Fee] = []
-    _total_fee: Fee = Fee(token0=Decimal(0), token1=Decimal(0))
+    _fee0: list[float] = []
+    _fee1: list[float] = []
+    _total_fee0: float = 0.0
+    _total_fee1: float = 0.0
+    # Position liquidity only changes on rebalance, see reset()
+    _pos_liq: float = PrivateAttr()
+    _pos_fee: float = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Refresh the cached position constants after the position changes."""
+        self._pos_liq = float(self.position.liquidity)
+        self._pos_fee = self._pos_liq * float(self.position.pool.fee)
 
     def compute_fee_for_swap(self, swap: Swap) -> Fee:
         total_liquidity = swap.liquidity + self.position.liquidity
@@ -44,21 +62,75 @@ class FeeCalculator(BaseModel):
             return Fee(token0=Decimal(0), token1=Decimal(0))
 
     def track(self, swap: Swap, is_active: bool) -> None:
-        fee = self.compute_fee_for_swap(swap)
+        fee0, fee1 = 0.0, 0.0
         if is_active:
-            self._timestamps.append(swap.timestamp)
-            self._fees.append(fee)
-            self._total_fee.token0 += fee.token0
-            self._total_fee.token1 += fee.token1
-        else:
-            self._timestamps.append(swap.timestamp)
-            self._fees.append(Fee(token0=Decimal(0), token1=Decimal(0)))
+            volume0 = float(swap.volume_token0)
+            volume1 = float(swap.volume_token1)
+            if volume0 > 0 and volume1 < 0:
+                fee0 = self._pos_fee * volume0 / (float(swap.liquidity) + self._pos_liq)
+                self._total_fee0 += fee0
+            elif volume1 > 0 and volume0 < 0:
+                fee1 = self._pos_fee * volume1 / (float(swap.liquidity) + self._pos_liq)
+                self._total_fee1 += fee1
+        self._timestamps.append(swap.timestamp)
+        self._fee0.append(fee0)
+        self._fee1.append(fee1)
+
+    def track_batch(
+        self,
+        timestamps: list[datetime],
+        volumes0: np.ndarray,
+        volumes1: np.ndarray,
+        liquidity: np.ndarray,
+        is_active: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized track over a block of swaps; returns the per-swap fees."""
+        fee0, fee1 = compute_fees(
+            volumes0,
+            volumes1,
+            liquidity,
+            self._pos_liq,
+            float(self.position.pool.fee),
+            is_active,
+        )
+        self.record_batch(timestamps, fee0, fee1)
+        return fee0, fee1
+
+    def track_series(
+        self, swap_series: SwapSeries, is_active: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Track a whole series; activity defaults to the current position bounds."""
+        arrays = swap_series.to_arrays()
+        if is_active is None:
+            is_active = compute_activity(
+                arrays["ticks"], self.position.tick_lower, self.position.tick_upper
+            )
+        return self.track_batch(
+            swap_series.timestamps,
+            arrays["volumes0"],
+            arrays["volumes1"],
+            arrays["liquidity"],
+            is_active,
+        )
+
+    def record_batch(
+        self, timestamps: list[datetime], fee0: np.ndarray, fee1: np.ndarray
+    ) -> None:
+        """Append precomputed per-swap fees (already zero where inactive)."""
+        self._timestamps.extend(timestamps)
+        self._fee0.extend(fee0.tolist())
+        self._fee1.extend(fee1.tolist())
+        self._total_fee0 += float(fee0.sum())
+        self._total_fee1 += float(fee1.sum())
 
     def get_timeseries(self) -> FeeTimeseries:
-        return FeeTimeseries(
-            timestamps=self._timestamps,
-            fees=self._fees,
+        return FeeTimeseries.model_construct(
+            timestamps=list(self._timestamps),
+            fees=[
+                Fee(token0=Decimal(a), token1=Decimal(b))
+                for a, b in zip(self._fee0, self._fee1)
+            ],
         )
 
     def get_total_fees(self) -> Fee:
-        return self._total_fee
\ No newline at end of file
+        return Fee(token0=Decimal(self._total_fee0), token1=Decimal(self._total_fee1))
\ No newline at end of file
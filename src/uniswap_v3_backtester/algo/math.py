@@ -1,32 +1,63 @@
-
 from decimal import Decimal
 
+import numpy as np
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+
+# sqrt(1.0001 ** tick) for every valid tick, indexed by ``tick - MIN_TICK``.
+_SQRT_LUT = np.power(1.0001, np.arange(MIN_TICK, MAX_TICK + 1) / 2)
+
+_Q192 = Decimal(2**192)
+
 
 def tick_to_price(tick: int) -> Decimal:
         return Decimal("1.0001") ** tick
 
-def tick_to_sqrt_price(tick: int) -> int:
+def tick_to_sqrt_price(tick: int) -> float:
     """Convert a tick to its corresponding square root price (P = sqrt(price))."""
-    return 1.0001 ** (tick / 2)
+    if not MIN_TICK <= tick <= MAX_TICK:
+        raise ValueError(f"tick {tick} is outside [{MIN_TICK}, {MAX_TICK}]")
+    return float(_SQRT_LUT[tick - MIN_TICK])
+
+def ticks_to_sqrt_prices(ticks: np.ndarray) -> np.ndarray:
+    """Vectorized tick_to_sqrt_price over an integer array of ticks."""
+    if ticks.size and (ticks.min() < MIN_TICK or ticks.max() > MAX_TICK):
+        raise ValueError(f"ticks must lie within [{MIN_TICK}, {MAX_TICK}]")
+    return _SQRT_LUT[ticks - MIN_TICK]
 
 def compute_token_amounts_from_liquidity(
     tick_lower: int, tick_upper: int, liquidity: Decimal, current_tick: int
 ) -> tuple[Decimal, Decimal]:
-    sqrt_price = Decimal(tick_to_sqrt_price(current_tick))
-    sqrt_price_lower = Decimal(tick_to_sqrt_price(tick_lower))
-    sqrt_price_upper = Decimal(tick_to_sqrt_price(tick_upper))
-    L = liquidity
-
-    if current_tick <= tick_lower:
-        amount0 = L * (1 / sqrt_price_lower - 1 / sqrt_price_upper)
-        amount1 = Decimal(0)
-    elif current_tick >= tick_upper:
-        amount0 = Decimal(0)
-        amount1 = L * (sqrt_price_upper - sqrt_price_lower)
-    else:
-        amount0 = L * (1 / sqrt_price - 1 / sqrt_price_upper)
-        amount1 = L * (sqrt_price - sqrt_price_lower)
+    sqrt_price_upper = tick_to_sqrt_price(tick_upper)
+    amount0, amount1 = compute_token_amounts_from_sqrt_prices(
+        float(liquidity),
+        tick_to_sqrt_price(current_tick),
+        tick_to_sqrt_price(tick_lower),
+        sqrt_price_upper,
+        1 / sqrt_price_upper,
+    )
+    return Decimal(amount0), Decimal(amount1)
+
+def compute_token_amounts_from_sqrt_prices(
+    liquidity: float,
+    sqrt_price: float,
+    sqrt_price_lower: float,
+    sqrt_price_upper: float,
+    inv_sqrt_price_upper: float,
+) -> tuple[float, float]:
+    """
+    Token amounts for a position whose bound-dependent terms are precomputed
+    (see Position.sqrt_price_lower / sqrt_price_upper / inv_sqrt_price_upper).
+    Out of range, the price is clamped to the nearest bound.
+    """
+    if sqrt_price < sqrt_price_lower:
+        sqrt_price = sqrt_price_lower
+    elif sqrt_price > sqrt_price_upper:
+        sqrt_price = sqrt_price_upper
 
+    amount0 = liquidity * (1 / sqrt_price - inv_sqrt_price_upper)
+    amount1 = liquidity * (sqrt_price - sqrt_price_lower)
     return amount0, amount1
 
 
@@ -40,7 +71,7 @@ def compute_impermanent_loss(
     il_base = (Decimal("2") * k.sqrt() / (Decimal("1") + k)) - Decimal("1")
     factor = Decimal("1") / (
         Decimal("1")
-        - ((k_min.sqrt() + k * (Decimal("1") / k_max).sqrt()) / (Decimal("1") + k))
+        - ((k_min.sqrt() + k / k_max.sqrt()) / (Decimal("1") + k))
     )
     return il_base * factor * Decimal("100")
 
@@ -73,21 +104,28 @@ def compute_token1_for_fixed_token0(
     tick_upper: int,
     current_tick: int,
 ) -> tuple[Decimal, Decimal]:
-    sqrtA = Decimal(tick_to_sqrt_price(tick_lower))
-    sqrtB = Decimal(tick_to_sqrt_price(tick_upper))
-    sqrtP = Decimal(tick_to_sqrt_price(current_tick))
+    sqrtA = tick_to_sqrt_price(tick_lower)
+    sqrtB = tick_to_sqrt_price(tick_upper)
+    sqrtP = tick_to_sqrt_price(current_tick)
+    amount0 = float(amount0)
 
     if current_tick <= tick_lower:
         liquidity = amount0 * sqrtA * sqrtB / (sqrtB - sqrtA)
-        amount1 = Decimal(0)
+        amount1 = 0.0
     elif current_tick >= tick_upper:
-        liquidity = Decimal(0)
-        amount1 = Decimal(0)
+        liquidity = 0.0
+        amount1 = 0.0
     else:
         liquidity = amount0 * sqrtP * sqrtB / (sqrtB - sqrtP)
         amount1 = liquidity * (sqrtP - sqrtA)
 
-    return liquidity, amount1
+    return Decimal(liquidity), Decimal(amount1)
+
+def sqrtPriceX96_to_price(sqrtPriceX96: int) -> Decimal:
+    """Raw price of token1 per token0 (no decimal adjustment) from a Q64.96 sqrt price."""
+    # Squaring the integer first is exact and needs a single division by 2**192
+    return Decimal(sqrtPriceX96 * sqrtPriceX96) / _Q192
+
 
 def sqrtPriceX96_to_price_adjusted(
     sqrtPriceX96: int,
@@ -99,18 +137,12 @@ def sqrtPriceX96_to_price_adjusted(
     adjusting for decimals of both tokens.
 
     Parameters:
-    - sqrtPriceX96 (Decimal): Q64.96 encoded square root price from Uniswap
+    - sqrtPriceX96 (int): Q64.96 encoded square root price from Uniswap
     - token0_decimals (int): Number of decimals for token0 (base)
     - token1_decimals (int): Number of decimals for token1 (quote)
 
     Returns:
     - Decimal: Human-readable price of token1 per token0
     """
-    Q96 = Decimal(2 ** 96)
-    sqrt_price = sqrtPriceX96 / Q96
-    price_raw = sqrt_price ** 2
-
-    decimal_adjustment = Decimal(10 ** (token0_decimals - token1_decimals))
-    price_adjusted = price_raw * decimal_adjustment
-
-    return price_adjusted
\ No newline at end of file
+    decimal_adjustment = Decimal(10) ** (token0_decimals - token1_decimals)
+    return sqrtPriceX96_to_price(sqrtPriceX96) * decimal_adjustment
@@ -1,7 +1,13 @@
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import cached_property
+from typing import Any
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, PrivateAttr
+
+from uniswap_v3_backtester.algo.math import tick_to_sqrt_price
 
 
 class Pool(BaseModel):
@@ -11,6 +17,11 @@ class Pool(BaseModel):
     fee: Decimal
 
 
+def check_tick_upper_greater_than_lower(tick_lower: int, tick_upper: int) -> None:
+    if tick_upper < tick_lower:
+        raise ValueError("tick_upper must be >= tick_lower")
+
+
 class Position(BaseModel):
     tick_lower: int
     tick_upper: int
@@ -19,8 +30,67 @@ class Position(BaseModel):
     pool: Pool
     liquidity: Decimal
 
+    # Bound-dependent values, refreshed whenever a tick bound is assigned
+    _width: int = PrivateAttr()
+    _sqrt_price_lower: float = PrivateAttr()
+    _sqrt_price_upper: float = PrivateAttr()
+    _inv_sqrt_price_upper: float = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        check_tick_upper_greater_than_lower(self.tick_lower, self.tick_upper)
+        self._refresh_bounds()
+
+    def __setattr__(self, name: str, value) -> None:
+        # The bounds invariant is enforced here, once per change, so that
+        # per-swap code can rely on it without rechecking
+        if name == "tick_lower":
+            check_tick_upper_greater_than_lower(value, self.tick_upper)
+        elif name == "tick_upper":
+            check_tick_upper_greater_than_lower(self.tick_lower, value)
+        super().__setattr__(name, value)
+        if name in ("tick_lower", "tick_upper"):
+            self._refresh_bounds()
+
+    def model_copy(self, *, update: dict | None = None, deep: bool = False) -> "Position":
+        # pydantic copies skip both __setattr__ and model_post_init, so the
+        # bounds are validated and the cached values rebuilt here
+        copy = super().model_copy(update=update, deep=deep)
+        check_tick_upper_greater_than_lower(copy.tick_lower, copy.tick_upper)
+        copy._refresh_bounds()
+        return copy
+
+    def set_bounds(self, tick_lower: int, tick_upper: int) -> None:
+        """Move both bounds at once, validating only the final range."""
+        check_tick_upper_greater_than_lower(tick_lower, tick_upper)
+        BaseModel.__setattr__(self, "tick_lower", tick_lower)
+        BaseModel.__setattr__(self, "tick_upper", tick_upper)
+        self._refresh_bounds()
+
+    def _refresh_bounds(self) -> None:
+        self._width = self.tick_upper - self.tick_lower
+        self._sqrt_price_lower = tick_to_sqrt_price(self.tick_lower)
+        self._sqrt_price_upper = tick_to_sqrt_price(self.tick_upper)
+        self._inv_sqrt_price_upper = 1 / self._sqrt_price_upper
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def sqrt_price_lower(self) -> float:
+        return self._sqrt_price_lower
 
-class Swap(BaseModel):
+    @property
+    def sqrt_price_upper(self) -> float:
+        return self._sqrt_price_upper
+
+    @property
+    def inv_sqrt_price_upper(self) -> float:
+        return self._inv_sqrt_price_upper
+
+
+@dataclass(slots=True, frozen=True)
+class Swap:
     tick: int
     volume_token0: Decimal
     volume_token1: Decimal
@@ -30,12 +100,55 @@ class Swap(BaseModel):
 
 
 class SwapSeries(BaseModel):
-    swaps: list[Swap]
+    # Immutable, so the cached views below can never go stale
+    swaps: tuple[Swap, ...]
 
-    @property
+    def __eq__(self, other: object) -> bool:
+        # Only the swaps count; the cached views would otherwise be compared too
+        if not isinstance(other, SwapSeries):
+            return NotImplemented
+        return self.swaps == other.swaps
+
+    # Derived views are built once per series
+    @cached_property
     def ticks(self) -> list[int]:
         return [s.tick for s in self.swaps]
 
-    @property
+    @cached_property
     def timestamps(self) -> list[datetime]:
         return [s.timestamp for s in self.swaps]
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Struct-of-arrays view of the series, one NumPy column per swap field.
+
+        Amounts are float64; sqrtPX96 is float64 as well since Q64.96 values
+        do not fit in int64. Timestamps are datetime64[ns]. The columns are
+        cached and shared between callers, so they are read-only.
+        """
+        return dict(self._arrays)
+
+    @cached_property
+    def _arrays(self) -> dict[str, np.ndarray]:
+        n = len(self.swaps)
+        arrays = {
+            "ticks": np.fromiter((s.tick for s in self.swaps), dtype=np.int64, count=n),
+            "volumes0": np.fromiter(
+                (s.volume_token0 for s in self.swaps), dtype=np.float64, count=n
+            ),
+            "volumes1": np.fromiter(
+                (s.volume_token1 for s in self.swaps), dtype=np.float64, count=n
+            ),
+            "liquidity": np.fromiter(
+                (s.liquidity for s in self.swaps), dtype=np.float64, count=n
+            ),
+            "sqrtPX96": np.fromiter(
+                (s.sqrt_price_x96 for s in self.swaps), dtype=np.float64, count=n
+            ),
+            "timestamps_ns": np.array(
+                [s.timestamp for s in self.swaps], dtype="datetime64[ns]"
+            ),
+        }
+        for column in arrays.values():
+            column.flags.writeable = False
+        return arrays
@@ -1,113 +1,187 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Annotated, List
+from typing import List, Protocol, runtime_checkable
 
-from pydantic import BaseModel, Field, field_validator, validate_call
+import numpy as np
 
 
-class RebalanceEvent(BaseModel):
+@dataclass(slots=True)
+class RebalanceEvent:
     timestamp: datetime
     rebalance_tick: int
     new_tick_lower: int
     new_tick_upper: int
 
 
-class RebalancerContext(BaseModel):
+@dataclass(slots=True)
+class RebalancerContext:
     tick: int
     timestamp: datetime
     tick_lower: int
     tick_upper: int
     created_at: datetime
 
+    @property
+    def width(self) -> int:
+        return self.tick_upper - self.tick_lower
+
 
 class LogicMode(Enum):
     AND = "and"
     OR = "or"
 
 
-class RebalancingStrategy(BaseModel):
+@runtime_checkable
+class RebalancingStrategy(Protocol):
+    __slots__ = ()
+
+    def should_rebalance(self, context: RebalancerContext) -> bool: ...
+
+    def rebalance(self, context: RebalancerContext) -> tuple[int, int]: ...
+
+    def get_event_at(self, timestamp: datetime) -> RebalanceEvent | None: ...
+
+
+@dataclass(slots=True, kw_only=True, eq=False)
+class BaseRebalancer(RebalancingStrategy):
+    """Shared bias handling and event log for the built-in strategies."""
+
+    # Share of the range placed below the tick, validated once at construction
+    bias: float = 0.5
+    # Events are stored column-wise in timestamp order; rows of _event_ticks
+    # are tick, lower, upper
+    _event_timestamps: list[datetime] = field(init=False, repr=False)
+    _event_ticks: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.bias <= 1.0:
+            raise ValueError("Bias must be between 0.0 and 1.0")
+        self._event_timestamps = []
+        self._event_ticks = np.empty((3, 8), dtype=np.int64)
+
     def should_rebalance(self, context: RebalancerContext) -> bool:
         raise NotImplementedError
 
-    @validate_call
-    def rebalance(
-        self, context: RebalancerContext, bias: Annotated[float, Field(ge=0.0, le=1.0)]
-    ) -> tuple[int, int]:
+    def rebalance(self, context: RebalancerContext) -> tuple[int, int]:
         raise NotImplementedError
 
+    def vectorized_triggers(
+        self,
+        ticks: np.ndarray,
+        timestamps: np.ndarray,
+        tick_lower: int,
+        tick_upper: int,
+        created_at: datetime,
+    ) -> np.ndarray:
+        """
+        Swaps on which should_rebalance must be called while the bounds stay
+        as they are now: those where it may return True or may change the
+        strategy's state. The mask may over-approximate but never miss one;
+        callers still confirm each flagged swap with should_rebalance. The
+        default flags every swap.
+        """
+        return np.ones(len(ticks), dtype=bool)
+
+    def _resets_on_check(self) -> bool:
+        """Whether should_rebalance may change this strategy's state."""
+        return False
+
+    def _has_event_log(self) -> bool:
+        """Whether the event log helpers below are available for this strategy."""
+        return True
+
+    def _tick_range(self, context: RebalancerContext) -> tuple[int, int]:
+        return compute_tick_range(context.tick, context.width, self.bias)
+
+    @property
+    def events(self) -> list[RebalanceEvent]:
+        return self._events_since(0)
+
     def get_event_at(self, timestamp: datetime) -> RebalanceEvent | None:
-        raise NotImplementedError
+        # bisect_left finds the first event at a timestamp, which is the one reported
+        index = bisect_left(self._event_timestamps, timestamp)
+        if index < len(self._event_timestamps) and self._event_timestamps[index] == timestamp:
+            return self._event(index)
+        return None
+
+    def _event_count(self) -> int:
+        return len(self._event_timestamps)
+
+    def _events_since(self, start: int) -> list[RebalanceEvent]:
+        return [self._event(i) for i in range(start, len(self._event_timestamps))]
+
+    def _event(self, index: int) -> RebalanceEvent:
+        tick, lower, upper = self._event_ticks[:, index].tolist()
+        return RebalanceEvent(
+            timestamp=self._event_timestamps[index],
+            rebalance_tick=tick,
+            new_tick_lower=lower,
+            new_tick_upper=upper,
+        )
+
+    def _record_event(self, context: RebalancerContext, new_lower: int, new_upper: int) -> None:
+        size = len(self._event_timestamps)
+        if size == self._event_ticks.shape[1]:
+            self._event_ticks = np.concatenate(
+                [self._event_ticks, np.empty_like(self._event_ticks)], axis=1
+            )
+        # Events normally arrive in time order, making this an append
+        index = bisect_right(self._event_timestamps, context.timestamp)
+        self._event_ticks[:, index + 1 : size + 1] = self._event_ticks[:, index:size]
+        self._event_ticks[:, index] = (context.tick, new_lower, new_upper)
+        self._event_timestamps.insert(index, context.timestamp)
 
 
 # --- Strategy Implementations ---
 
 
-class TimeTriggeredRebalancer(RebalancingStrategy):
+@dataclass(slots=True, kw_only=True, eq=False)
+class TimeTriggeredRebalancer(BaseRebalancer):
     interval: timedelta
     last_rebalanced_at: datetime | None = None
-    _events: list[RebalanceEvent] = []
 
-    @field_validator("interval")
-    @classmethod
-    def validate_interval(cls, v: timedelta) -> timedelta:
-        if v.total_seconds() < 0:
+    def __post_init__(self) -> None:
+        BaseRebalancer.__post_init__(self)
+        if self.interval.total_seconds() < 0:
             raise ValueError("Interval must be non-negative")
-        return v
 
     def should_rebalance(self, context: RebalancerContext) -> bool:
-        check_tick_upper_greater_than_lower(context.tick_lower, context.tick_upper)
         reference = self.last_rebalanced_at or context.created_at
         return (context.timestamp - reference) > self.interval
 
-    def rebalance(self, context: RebalancerContext, bias: float) -> tuple[int, int]:
-        width = context.tick_upper - context.tick_lower
-        new_lower, new_upper = compute_tick_range(context.tick, width, bias)
+    def vectorized_triggers(self, ticks, timestamps, tick_lower, tick_upper, created_at):
+        reference = _to_datetime64(self.last_rebalanced_at or created_at)
+        return (timestamps - reference) > np.timedelta64(self.interval)
+
+    def rebalance(self, context: RebalancerContext) -> tuple[int, int]:
+        new_lower, new_upper = self._tick_range(context)
         self.last_rebalanced_at = context.timestamp
-        self._events.append(
-            RebalanceEvent(
-                timestamp=context.timestamp,
-                rebalance_tick=context.tick,
-                new_tick_lower=new_lower,
-                new_tick_upper=new_upper,
-            )
-        )
+        self._record_event(context, new_lower, new_upper)
         return new_lower, new_upper
 
-    def get_event_at(self, timestamp: datetime) -> RebalanceEvent | None:
-        return next((e for e in self._events if e.timestamp == timestamp), None)
-
-
-class OutOfRangeRebalancer(RebalancingStrategy):
-    _events: list[RebalanceEvent] = []
 
+@dataclass(slots=True, kw_only=True, eq=False)
+class OutOfRangeRebalancer(BaseRebalancer):
     def should_rebalance(self, context: RebalancerContext) -> bool:
-        check_tick_upper_greater_than_lower(context.tick_lower, context.tick_upper)
         return not (context.tick_lower <= context.tick <= context.tick_upper)
 
-    def rebalance(self, context: RebalancerContext, bias: float) -> tuple[int, int]:
-        width = context.tick_upper - context.tick_lower
-        new_lower, new_upper = compute_tick_range(context.tick, width, bias)
-        self._events.append(
-            RebalanceEvent(
-                timestamp=context.timestamp,
-                rebalance_tick=context.tick,
-                new_tick_lower=new_lower,
-                new_tick_upper=new_upper,
-            )
-        )
-        return new_lower, new_upper
+    def vectorized_triggers(self, ticks, timestamps, tick_lower, tick_upper, created_at):
+        return (ticks < tick_lower) | (ticks > tick_upper)
 
-    def get_event_at(self, timestamp: datetime) -> RebalanceEvent | None:
-        return next((e for e in self._events if e.timestamp == timestamp), None)
+    def rebalance(self, context: RebalancerContext) -> tuple[int, int]:
+        new_lower, new_upper = self._tick_range(context)
+        self._record_event(context, new_lower, new_upper)
+        return new_lower, new_upper
 
 
-class OutOfRangeDurationRebalancer(RebalancingStrategy):
+@dataclass(slots=True, kw_only=True, eq=False)
+class OutOfRangeDurationRebalancer(BaseRebalancer):
     duration: timedelta
     out_of_range_since: datetime | None = None
-    _events: list[RebalanceEvent] = []
 
     def should_rebalance(self, context: RebalancerContext) -> bool:
-        check_tick_upper_greater_than_lower(context.tick_lower, context.tick_upper)
         in_range = context.tick_lower <= context.tick <= context.tick_upper
 
         if in_range:
@@ -117,48 +191,137 @@ class OutOfRangeDurationRebalancer(RebalancingStrategy):
         reference = self.out_of_range_since or context.created_at
         return (context.timestamp - reference) >= self.duration
 
-    def rebalance(self, context: RebalancerContext, bias: float) -> tuple[int, int]:
-        width = context.tick_upper - context.tick_lower
-        new_lower, new_upper = compute_tick_range(context.tick, width, bias)
+    def vectorized_triggers(self, ticks, timestamps, tick_lower, tick_upper, created_at):
+        out_of_range = (ticks < tick_lower) | (ticks > tick_upper)
+        duration = np.timedelta64(self.duration)
+        mask = out_of_range & ((timestamps - _to_datetime64(created_at)) >= duration)
+        if self.out_of_range_since is not None:
+            # out_of_range_since is the reference until the first in-range swap
+            # resets it; that swap is flagged so should_rebalance runs the reset
+            in_range = np.flatnonzero(~out_of_range)
+            first = in_range[0] if len(in_range) else len(ticks)
+            elapsed = timestamps[:first] - _to_datetime64(self.out_of_range_since)
+            mask[:first] = out_of_range[:first] & (elapsed >= duration)
+            mask[first : first + 1] = True
+        return mask
+
+    def _resets_on_check(self) -> bool:
+        return self.out_of_range_since is not None
+
+    def rebalance(self, context: RebalancerContext) -> tuple[int, int]:
+        new_lower, new_upper = self._tick_range(context)
         self.out_of_range_since = None
-        self._events.append(
-            RebalanceEvent(
-                timestamp=context.timestamp,
-                rebalance_tick=context.tick,
-                new_tick_lower=new_lower,
-                new_tick_upper=new_upper,
-            )
-        )
+        self._record_event(context, new_lower, new_upper)
         return new_lower, new_upper
 
-    def get_event_at(self, timestamp: datetime) -> RebalanceEvent | None:
-        return next((e for e in self._events if e.timestamp == timestamp), None)
-
 
-class MultiConditionRebalancer(RebalancingStrategy):
+@dataclass(slots=True, kw_only=True, eq=False)
+class MultiConditionRebalancer(BaseRebalancer):
+    # The chosen child's own bias places the new range, so the combinator
+    # does not accept one
+    bias: float = field(default=0.5, init=False, repr=False)
     strategies: List[RebalancingStrategy]
     mode: LogicMode
+    _merged: tuple[list[datetime], list[RebalanceEvent]] = field(
+        init=False, repr=False, default_factory=lambda: ([], [])
+    )
+    _merged_counts: list[int] = field(init=False, repr=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        BaseRebalancer.__post_init__(self)
+        self.mode = LogicMode(self.mode)
 
     def should_rebalance(self, context: RebalancerContext) -> bool:
-        check_tick_upper_greater_than_lower(context.tick_lower, context.tick_upper)
         if not self.strategies:
             return False
-        checks = [s.should_rebalance(context) for s in self.strategies]
-        return all(checks) if self.mode == LogicMode.AND else any(checks)
+        # Stop evaluating at the first strategy that decides the result, but
+        # still let the remaining stateful strategies see the swap
+        decisive = self.mode != LogicMode.AND
+        for index, s in enumerate(self.strategies):
+            if s.should_rebalance(context) == decisive:
+                for rest in self.strategies[index + 1 :]:
+                    if _resets_on_check(rest):
+                        rest.should_rebalance(context)
+                return decisive
+        return not decisive
+
+    def vectorized_triggers(self, ticks, timestamps, tick_lower, tick_upper, created_at):
+        if not self.strategies:
+            return np.zeros(len(ticks), dtype=bool)
+        # OR-ing the children's masks in AND mode keeps every swap a stateful
+        # child needs to see, at the cost of checking more swaps
+        if self.mode == LogicMode.AND and not self._resets_on_check():
+            combine = np.logical_and
+        else:
+            combine = np.logical_or
+        return combine.reduce(
+            [
+                rebalance_triggers(s, ticks, timestamps, tick_lower, tick_upper, created_at)
+                for s in self.strategies
+            ]
+        )
 
-    def rebalance(self, context: RebalancerContext, bias: float) -> tuple[int, int]:
+    def rebalance(self, context: RebalancerContext) -> tuple[int, int]:
         for s in self.strategies:
             if s.should_rebalance(context):
-                return s.rebalance(context, bias)
+                return s.rebalance(context)
         raise RuntimeError("No eligible strategy triggered rebalance.")
 
     def get_event_at(self, timestamp: datetime) -> RebalanceEvent | None:
-        for s in self.strategies:
-            event = s.get_event_at(timestamp)
-            if event:
-                return event
+        if not self._has_event_log():
+            # Protocol-only children expose just get_event_at; ask each in turn
+            for s in self.strategies:
+                event = s.get_event_at(timestamp)
+                if event is not None:
+                    return event
+            return None
+        timestamps, events = self._merged_index()
+        index = bisect_left(timestamps, timestamp)
+        if index < len(timestamps) and timestamps[index] == timestamp:
+            return events[index]
         return None
 
+    def _resets_on_check(self) -> bool:
+        return any(_resets_on_check(s) for s in self.strategies)
+
+    def _has_event_log(self) -> bool:
+        return all(_has_event_log(s) for s in self.strategies)
+
+    def _event_count(self) -> int:
+        return sum(s._event_count() for s in self.strategies)
+
+    def _events_since(self, start: int) -> list[RebalanceEvent]:
+        return self._merged_index()[1][start:]
+
+    def _merged_index(self) -> tuple[list[datetime], list[RebalanceEvent]]:
+        # Children only ever gain events, so only the new ones are merged in
+        counts = [s._event_count() for s in self.strategies]
+        if counts == self._merged_counts:
+            return self._merged
+        timestamps, events = self._merged
+        starts = self._merged_counts
+        if len(starts) != len(counts):
+            timestamps, events, starts = [], [], [0] * len(counts)
+        new = self._sorted_events(starts)
+        if timestamps and new and new[0][0] <= timestamps[-1]:
+            # Out-of-order or tied arrival: rebuild so ties keep strategy order
+            timestamps, events, new = [], [], self._sorted_events([0] * len(counts))
+        timestamps.extend(item[0] for item in new)
+        events.extend(item[2] for item in new)
+        self._merged = (timestamps, events)
+        self._merged_counts = counts
+        return self._merged
+
+    def _sorted_events(self, starts: list[int]) -> list[tuple[datetime, int, RebalanceEvent]]:
+        return sorted(
+            (
+                (event.timestamp, k, event)
+                for k, s in enumerate(self.strategies)
+                for event in s._events_since(starts[k])
+            ),
+            key=lambda item: item[:2],
+        )
+
 
 def compute_tick_range(tick: int, width: int, bias: float) -> tuple[int, int]:
     """
@@ -167,14 +330,34 @@ def compute_tick_range(tick: int, width: int, bias: float) -> tuple[int, int]:
     - bias = 0.0 → all above tick (token0-heavy)
     - bias = 1.0 → all below tick (token1-heavy)
     """
-    if not 0.0 <= bias <= 1.0:
-        raise ValueError("Bias must be between 0.0 and 1.0")
-
     left = int(width * bias)
     right = width - left
     return tick - left, tick + right
 
 
-def check_tick_upper_greater_than_lower(tick_lower: int, tick_upper: int) -> None:
-    if tick_upper < tick_lower:
-        raise ValueError("tick_upper must be >= tick_lower")
+def rebalance_triggers(
+    strategy: RebalancingStrategy,
+    ticks: np.ndarray,
+    timestamps: np.ndarray,
+    tick_lower: int,
+    tick_upper: int,
+    created_at: datetime,
+) -> np.ndarray:
+    """Trigger mask of a strategy, flagging every swap if it has no vectorized_triggers."""
+    triggers = getattr(strategy, "vectorized_triggers", None)
+    if triggers is None:
+        return np.ones(len(ticks), dtype=bool)
+    return triggers(ticks, timestamps, tick_lower, tick_upper, created_at)
+
+
+def _resets_on_check(strategy: RebalancingStrategy) -> bool:
+    return isinstance(strategy, BaseRebalancer) and strategy._resets_on_check()
+
+
+def _has_event_log(strategy: RebalancingStrategy) -> bool:
+    return isinstance(strategy, BaseRebalancer) and strategy._has_event_log()
+
+
+def _to_datetime64(timestamp: datetime) -> np.datetime64:
+    # Same conversion SwapSeries.to_arrays applies to swap timestamps
+    return np.array([timestamp], dtype="datetime64[ns]")[0]
@@ -1,36 +1,70 @@
+import numpy as np
+from matplotlib import dates as mdates
 from matplotlib import pyplot as plt
 
 from uniswap_v3_backtester.algo.backtester import BacktestResult
 
+# Longer series are stride-decimated before plotting
+MAX_PLOT_POINTS = 50_000
+
+
+def _downsample(x: np.ndarray, *ys: np.ndarray) -> tuple[np.ndarray, ...]:
+    step = -(-len(x) // MAX_PLOT_POINTS)
+    if step <= 1:
+        return (x, *ys)
+    idx = np.arange(0, len(x), step)
+    if idx[-1] != len(x) - 1:
+        idx = np.append(idx, len(x) - 1)
+    return (x[idx], *(y[idx] for y in ys))
+
 
 def plot_position_evolution(result: BacktestResult) -> None:
     # Unpack token balances
     timestamps, token0s, token1s = zip(*result.token_balance_series)
-    token0s = [float(t) for t in token0s]
-    token1s = [float(t) for t in token1s]
+    timestamps = mdates.date2num(timestamps)
+    token0s = np.fromiter(map(float, token0s), dtype=np.float64, count=len(token0s))
+    token1s = np.fromiter(map(float, token1s), dtype=np.float64, count=len(token1s))
 
     # Extract ticks
     tick_times, ticks = zip(*result.swap_ticks)
-    ticks = [float(t) for t in ticks]
+    tick_times = mdates.date2num(tick_times)
+    ticks = np.asarray(ticks, dtype=np.float64)
 
     # Cumulative fee evolution
-    fee_token0s = [float(f.token0) for f in result.fee_series.fees]
-    fee_token1s = [float(f.token1) for f in result.fee_series.fees]
-    fee_cum0 = [sum(fee_token0s[: i + 1]) for i in range(len(fee_token0s))]
-    fee_cum1 = [sum(fee_token1s[: i + 1]) for i in range(len(fee_token1s))]
+    fees = result.fee_series.fees
+    fee_cum0 = np.cumsum(
+        np.fromiter((float(f.token0) for f in fees), dtype=np.float64, count=len(fees))
+    )
+    fee_cum1 = np.cumsum(
+        np.fromiter((float(f.token1) for f in fees), dtype=np.float64, count=len(fees))
+    )
 
     # IL data
-    il_timestamps = result.il_series.timestamps
-    il_values = [float(v) for v in result.il_series.values]
+    il_timestamps = mdates.date2num(result.il_series.timestamps)
+    il_values = np.fromiter(
+        map(float, result.il_series.values), dtype=np.float64, count=len(il_timestamps)
+    )
     ril_timestamps = result.realized_il.timestamps
-    ril_values = [float(v) for v in result.realized_il.values]
+    ril_values = np.fromiter(
+        map(float, result.realized_il.values), dtype=np.float64, count=len(ril_timestamps)
+    )
 
     # APR timeseries
     apr_dates = result.apr_series.dates
-    apr_values = [float(a) for a in result.apr_series.aprs]  # annualized % view
+    apr_values = np.fromiter(
+        map(float, result.apr_series.aprs), dtype=np.float64, count=len(apr_dates)
+    )  # annualized % view
+
+    # Reduce the dense per-swap series before handing them to the renderer
+    tick_times, ticks = _downsample(tick_times, ticks)
+    il_timestamps, il_values = _downsample(il_timestamps, il_values)
+    fee_times, fee_cum0, fee_cum1 = _downsample(timestamps, fee_cum0, fee_cum1)
+    timestamps, token0s, token1s = _downsample(timestamps, token0s, token1s)
 
     # Create figure
-    fig, axs = plt.subplots(6, 1, figsize=(14, 16), sharex=True)
+    fig, axs = plt.subplots(6, 1, figsize=(14, 16), sharex=True, constrained_layout=True)
+    for ax in axs:
+        ax.xaxis_date()
 
     # --- [0] Tick Evolution ---
     axs[0].plot(tick_times, ticks, label="Current Tick", color="black")
@@ -38,14 +72,19 @@ def plot_position_evolution(result: BacktestResult) -> None:
     axs[0].legend()
     axs[0].grid(True)
 
-    # Shade active/inactive periods
-    for t0, t1, active in zip(
-        result.activity_series.timestamps[:-1],
-        result.activity_series.timestamps[1:],
-        result.activity_series.activity[:-1],
-    ):
-        color = "green" if active else "red"
-        axs[0].axvspan(t0, t1, color=color, alpha=0.2)
+    # Shade active/inactive periods, one collection per color over merged runs
+    active = np.asarray(result.activity_series.activity[:-1], dtype=bool)
+    if len(active):
+        edges = mdates.date2num(result.activity_series.timestamps)
+        change = np.flatnonzero(np.diff(active.astype(np.int8))) + 1
+        starts = np.concatenate(([0], change))
+        ends = np.concatenate((change, [len(active)]))
+        for is_active, color in ((True, "green"), (False, "red")):
+            runs = active[starts] == is_active
+            xranges = list(zip(edges[starts[runs]], edges[ends[runs]] - edges[starts[runs]]))
+            axs[0].broken_barh(
+                xranges, (0, 1), transform=axs[0].get_xaxis_transform(), color=color, alpha=0.2
+            )
 
     # Tick bounds per active range
     rebalance_times = [event.timestamp for event in result.rebalancing_events]
@@ -86,13 +125,13 @@ def plot_position_evolution(result: BacktestResult) -> None:
 
     # --- [3] Cumulative Fees ---
     ax3 = axs[3]
-    ln1 = ax3.plot(timestamps, fee_cum0, label="Cumulative Fees Token0", color="blue")
+    ln1 = ax3.plot(fee_times, fee_cum0, label="Cumulative Fees Token0", color="blue")
     ax3.set_ylabel("Fees Token0", color="blue")
     ax3.tick_params(axis="y", labelcolor="blue")
     ax3.grid(True)
 
     ax3b = ax3.twinx()
-    ln2 = ax3b.plot(timestamps, fee_cum1, label="Cumulative Fees Token1", color="orange")
+    ln2 = ax3b.plot(fee_times, fee_cum1, label="Cumulative Fees Token1", color="orange")
     ax3b.set_ylabel("Fees Token1", color="orange")
     ax3b.tick_params(axis="y", labelcolor="orange")
 
@@ -110,6 +149,5 @@ def plot_position_evolution(result: BacktestResult) -> None:
     # --- [5] Placeholder for future additions (e.g., LP fees APR or compounding) ---
     axs[5].axis("off")  # reserved space
 
-    plt.suptitle("Backtest Position Evolution")
-    plt.tight_layout()
+    fig.suptitle("Backtest Position Evolution")
     plt.show()
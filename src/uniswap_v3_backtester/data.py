@@ -1,26 +1,43 @@
+from collections.abc import Iterator
 from datetime import datetime
 
+from sqlalchemy import Row, select
+
 from uniswap_v3_backtester.db.db import SessionLocal
 from uniswap_v3_backtester.db.db_models import Block, UniswapV3Swap
 
+QUERY_BATCH_SIZE = 10_000
 
-def run_orm_query(pool: str, start: str, end: str):
-    session = SessionLocal()
-    try:
-        start_dt = datetime.strptime(start, "%Y-%m-%d")
-        end_dt = datetime.strptime(end, "%Y-%m-%d")
 
-        pool = pool.lower()
+def run_orm_query(pool: str, start: datetime, end: datetime) -> Iterator[Row]:
+    """
+    Stream the pool's swaps as plain rows, skipping ORM instance construction.
 
-        results = (
-            session.query(UniswapV3Swap, Block.block_date.label("timestamp"))
-            .join(Block, UniswapV3Swap.block_number == Block.block_number)
-            .filter(UniswapV3Swap.pool_address == pool)
-            .filter(Block.block_date.between(start_dt, end_dt))
-            .order_by(Block.block_date.asc())
-            .all()
+    Rows are fetched in batches of ``QUERY_BATCH_SIZE`` while the caller
+    iterates; the session stays open until the iterator is exhausted or
+    closed. ``pool`` must already be the lowercased address, as stored in the
+    table.
+    """
+    # Resolve the date window to blocks first (ix_block_date), then join the
+    # pool's swaps on block number (ix_swap_pool_block)
+    block_range = (
+        select(Block.block_number, Block.block_date)
+        .where(Block.block_date.between(start, end))
+        .cte("block_range")
+    )
+    stmt = (
+        select(
+            UniswapV3Swap.tick,
+            UniswapV3Swap.sqrt_price_x96,
+            UniswapV3Swap.volume_token0,
+            UniswapV3Swap.volume_token1,
+            UniswapV3Swap.liquidity,
+            block_range.c.block_date.label("timestamp"),
         )
-    finally:
-        session.close()
-
-    return results
+        .join(block_range, UniswapV3Swap.block_number == block_range.c.block_number)
+        .where(UniswapV3Swap.pool_address == pool)
+        .order_by(block_range.c.block_date.asc())
+        .execution_options(yield_per=QUERY_BATCH_SIZE)
+    )
+    with SessionLocal.begin() as session:
+        yield from session.execute(stmt)
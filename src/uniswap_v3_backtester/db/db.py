@@ -3,11 +3,14 @@ from sqlalchemy.orm import sessionmaker
 
 from uniswap_v3_backtester.config import Config
 
+engine = create_engine(
+    Config.sqlalchemy_url(),
+    pool_size=8,
+    max_overflow=16,
+    pool_pre_ping=True,
+)
+SessionLocal = sessionmaker(bind=engine)
 
 
 def get_engine():
-    return create_engine(Config.sqlalchemy_url())
-
-
-engine = create_engine(Config.sqlalchemy_url())
-SessionLocal = sessionmaker(bind=engine)
+    return engine
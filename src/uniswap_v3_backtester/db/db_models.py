@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy import Column, DateTime, Index, Integer, String
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -6,7 +6,10 @@ Base = declarative_base()
 
 class UniswapV3Swap(Base):
     __tablename__ = "uniswap_v3_swap_42161"
-    __table_args__ = {"schema": "public"}
+    __table_args__ = (
+        Index("ix_swap_pool_block", "pool_address", "block_number"),
+        {"schema": "public"},
+    )
 
     tx_hash = Column(String(66), primary_key=True)
     block_number = Column(Integer)
@@ -21,7 +24,10 @@ class UniswapV3Swap(Base):
 
 class Block(Base):
     __tablename__ = "blocks_42161"
-    __table_args__ = {"schema": "public"}
+    __table_args__ = (
+        Index("ix_block_date", "block_date"),
+        {"schema": "public"},
+    )
 
     block_number = Column(Integer, primary_key=True)
     block_date = Column(DateTime)
@@ -5,14 +5,21 @@ import pytest
 
 from uniswap_v3_backtester.algo.pool import Pool, Position, Swap, SwapSeries
 
+POOL_FEE = Decimal("0.003")  # 0.3%
+POSITION_AMOUNT0 = Decimal("10")
+POSITION_AMOUNT1 = Decimal("20000")
+POSITION_LIQUIDITY = Decimal(1e6)
+SWAP_LIQUIDITY = Decimal("10000")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def pool() -> Pool:
+    # Never mutated by tests, so one instance is shared
     return Pool(
         address="0xPool",
         token0="ETH",
         token1="USDC",
-        fee=Decimal("0.003"),  # 0.3%
+        fee=POOL_FEE,
     )
 
 
@@ -21,41 +28,46 @@ def position(pool: Pool) -> Position:
     return Position(
         tick_lower=1000,
         tick_upper=2000,
-        amount0=Decimal("10"),
-        amount1=Decimal("20000"),
+        amount0=POSITION_AMOUNT0,
+        amount1=POSITION_AMOUNT1,
         pool=pool,
-        liquidity=Decimal(1e6),
+        liquidity=POSITION_LIQUIDITY,
     )
 
 
-@pytest.fixture
-def swap_series() -> SwapSeries:
+@pytest.fixture(scope="session")
+def _session_swaps() -> tuple[Swap, ...]:
     now = datetime.now()
-    return SwapSeries(
-        swaps=[
-            Swap(
-                tick=950,
-                volume_token0=Decimal("100"),
-                volume_token1=Decimal("200"),
-                liquidity=Decimal("10000"),
-                sqrt_price_x96=100000,
-                timestamp=now,
-            ),
-            Swap(
-                tick=1500,
-                volume_token0=Decimal("150"),
-                volume_token1=Decimal("250"),
-                liquidity=Decimal("10000"),
-                sqrt_price_x96=200000,
-                timestamp=now + timedelta(minutes=1),
-            ),
-            Swap(
-                tick=2100,
-                volume_token0=Decimal("200"),
-                volume_token1=Decimal("300"),
-                liquidity=Decimal("10000"),
-                sqrt_price_x96=200000,
-                timestamp=now + timedelta(minutes=2),
-            ),
-        ]
+    return (
+        Swap(
+            tick=950,
+            volume_token0=Decimal("100"),
+            volume_token1=Decimal("200"),
+            liquidity=SWAP_LIQUIDITY,
+            sqrt_price_x96=100000,
+            timestamp=now,
+        ),
+        Swap(
+            tick=1500,
+            volume_token0=Decimal("150"),
+            volume_token1=Decimal("250"),
+            liquidity=SWAP_LIQUIDITY,
+            sqrt_price_x96=200000,
+            timestamp=now + timedelta(minutes=1),
+        ),
+        Swap(
+            tick=2100,
+            volume_token0=Decimal("200"),
+            volume_token1=Decimal("300"),
+            liquidity=SWAP_LIQUIDITY,
+            sqrt_price_x96=200000,
+            timestamp=now + timedelta(minutes=2),
+        ),
     )
+
+
+@pytest.fixture
+def swap_series(_session_swaps: tuple[Swap, ...]) -> SwapSeries:
+    # Swaps are frozen, but SwapSeries caches derived views, so each test
+    # gets its own series
+    return SwapSeries(swaps=_session_swaps)
@@ -39,6 +39,12 @@ def test_track_timeseries(position, swap_series):
     assert timeseries.timestamps == swap_series.timestamps
 
 
+def test_track_returns_activity(position, swap_series):
+    tracker = ActivityTracker(position=position)
+    returned = [tracker.track(swap) for swap in swap_series.swaps]
+    assert returned == tracker.activity
+
+
 def test_track_empty_series(position):
     tracker = ActivityTracker(position=position)
     empty_series = SwapSeries(swaps=[])
@@ -122,3 +128,45 @@ def test_tracker_updates_position_amounts_by_range(position, tick, expected_rang
 
     assert tracker.amounts_token0[-1] == pytest.approx(expected_amount0, abs=1e-8)
     assert tracker.amounts_token1[-1] == pytest.approx(expected_amount1, abs=1e-8)
+
+
+def test_track_batch_matches_track(position, swap_series):
+    looped = ActivityTracker(position=position.model_copy())
+    for swap in swap_series.swaps:
+        looped.track(swap)
+
+    batched = ActivityTracker(position=position.model_copy())
+    arrays = swap_series.to_arrays()
+    active = batched.track_batch(swap_series.timestamps, arrays["ticks"])
+
+    assert active.tolist() == looped.activity
+    assert batched.get_timeseries() == looped.get_timeseries()
+    assert batched.amounts_token0 == pytest.approx(looped.amounts_token0, rel=1e-12)
+    assert batched.amounts_token1 == pytest.approx(looped.amounts_token1, rel=1e-12)
+    assert batched.position.amount0 == looped.position.amount0
+
+
+def test_track_uses_bounds_assigned_after_creation(position, swap_series):
+    tracker = ActivityTracker(position=position)
+    position.tick_lower = 1400
+    position.tick_upper = 1600
+
+    tracker.track(swap_series.swaps[1])
+
+    expected_amount0, expected_amount1 = compute_token_amounts_from_liquidity(
+        tick_lower=1400, tick_upper=1600, liquidity=position.liquidity, current_tick=1500
+    )
+    assert position.amount0 == expected_amount0
+    assert position.amount1 == expected_amount1
+
+
+def test_track_series_matches_track(position, swap_series):
+    looped = ActivityTracker(position=position.model_copy())
+    for swap in swap_series.swaps:
+        looped.track(swap)
+
+    batched = ActivityTracker(position=position.model_copy())
+    batched.track_series(swap_series)
+
+    assert batched.get_timeseries() == looped.get_timeseries()
+    assert batched.amounts_token0 == pytest.approx(looped.amounts_token0, rel=1e-12)
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+from decimal import Decimal, DivisionByZero
+
+import pytest
+
+from uniswap_v3_backtester.algo.apr import APRTracker
+
+Q96 = 2**96
+day0 = datetime(2024, 1, 1)
+
+
+def make_tracker() -> APRTracker:
+    return APRTracker(
+        initial_token0=Decimal("100"),
+        initial_token1=Decimal("100"),
+        initial_tick=0,
+        token0_decimals=0,
+        token1_decimals=0,
+    )
+
+
+def test_apr_uses_last_state_of_each_day():
+    tracker = make_tracker()
+    zero = Decimal(0)
+    tracker.track(day0, Decimal(100), Decimal(100), zero, zero, Q96)
+    tracker.track(
+        day0 + timedelta(days=1, hours=1), Decimal(1), Decimal(1), zero, zero, Q96
+    )
+    tracker.track(
+        day0 + timedelta(days=1, hours=2), Decimal(100), Decimal(110), zero, zero, Q96
+    )
+
+    result = tracker.compute_apr_on_dates(
+        [day0, day0 + timedelta(days=1), day0 + timedelta(days=3)]
+    )
+
+    assert result.dates == [day0 + timedelta(days=1), day0 + timedelta(days=3)]
+    # LP value 210 vs HODL value 200 at price 1
+    assert [float(a) for a in result.aprs] == pytest.approx([5.0, 5.0])
+
+
+def test_apr_without_tracking_is_empty():
+    result = make_tracker().compute_apr_on_dates([day0])
+    assert result.dates == []
+    assert result.aprs == []
+
+
+def test_apr_with_zero_hodl_value_raises():
+    zero = Decimal(0)
+    tracker = APRTracker(
+        initial_token0=zero,
+        initial_token1=zero,
+        initial_tick=0,
+        token0_decimals=0,
+        token1_decimals=0,
+    )
+    tracker.track(day0, Decimal(100), Decimal(100), zero, zero, Q96)
+    tracker.track(day0 + timedelta(days=1), Decimal(100), Decimal(100), zero, zero, Q96)
+
+    with pytest.raises(DivisionByZero):
+        tracker.compute_apr_on_dates([day0 + timedelta(days=1)])
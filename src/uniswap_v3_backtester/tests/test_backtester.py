@@ -0,0 +1,129 @@
+from dataclasses import replace
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+
+from uniswap_v3_backtester.algo.activity import ActivityTracker
+from uniswap_v3_backtester.algo.apr import APRTracker
+from uniswap_v3_backtester.algo.backtester import (
+    GlobalClockBacktestRunner,
+    PositionSimulationContext,
+)
+from uniswap_v3_backtester.algo.fees import FeeCalculator
+from uniswap_v3_backtester.algo.Impermanent_Loss import ImpermanentLossTracker
+from uniswap_v3_backtester.algo.pool import Position, SwapSeries
+from uniswap_v3_backtester.algo.rebalancer import (
+    OutOfRangeDurationRebalancer,
+    TimeTriggeredRebalancer,
+)
+
+
+def make_simulation(position: Position, swap_series: SwapSeries, rebalancer=None):
+    position = position.model_copy()
+    return PositionSimulationContext(
+        position=position,
+        created_at=swap_series.swaps[0].timestamp,
+        swap_series=swap_series,
+        tracker=ActivityTracker(position=position),
+        calculator=FeeCalculator(position=position),
+        il_tracker=ImpermanentLossTracker(
+            entry_tick=1500,
+            entry_token0=position.amount0,
+            entry_token1=position.amount1,
+            tick_lower=position.tick_lower,
+            tick_upper=position.tick_upper,
+        ),
+        apr_tracker=APRTracker(
+            initial_token0=position.amount0,
+            initial_token1=position.amount1,
+            initial_tick=1500,
+        ),
+        rebalancer=rebalancer,
+    )
+
+
+def as_floats(rows):
+    return [(t, float(a), float(b)) for t, a, b in rows]
+
+
+def test_batched_and_stepped_contexts_agree(position, swap_series):
+    first, second, third = swap_series.swaps
+    swap_series = SwapSeries(
+        swaps=[first, replace(second, volume_token1=Decimal("-250")), third]
+    )
+    batched = make_simulation(position, swap_series)
+    # Never triggers, but forces the swap-by-swap path
+    stepped = make_simulation(
+        position, swap_series, TimeTriggeredRebalancer(interval=timedelta(days=365))
+    )
+
+    output = GlobalClockBacktestRunner(contexts=[batched, stepped]).run()
+    a, b = output.results
+
+    assert a.activity_series == b.activity_series
+    assert a.swap_ticks == b.swap_ticks
+    assert float(a.total_fees_token0) == pytest.approx(float(b.total_fees_token0))
+    assert float(a.total_fees_token0) > 0
+    assert as_floats(a.token_balance_series) == pytest.approx(as_floats(b.token_balance_series))
+    assert as_floats(a.token_composition_series) == pytest.approx(
+        as_floats(b.token_composition_series)
+    )
+    assert a.il_series.values == pytest.approx(b.il_series.values)
+    assert b.rebalancing_events == []
+
+
+def test_each_swap_processed_once(position, swap_series):
+    duplicated = SwapSeries(swaps=[swap_series.swaps[0], *swap_series.swaps])
+    context = make_simulation(
+        position, duplicated, TimeTriggeredRebalancer(interval=timedelta(days=365))
+    )
+
+    result = GlobalClockBacktestRunner(contexts=[context]).run().results[0]
+
+    assert len(result.token_balance_series) == len(duplicated.swaps)
+    assert result.activity_series.timestamps == duplicated.timestamps
+
+
+def test_in_range_swap_resets_out_of_range_duration(position, swap_series):
+    t0 = swap_series.swaps[0].timestamp
+    first, in_range, out_of_range = swap_series.swaps
+    series = SwapSeries(
+        swaps=[
+            replace(first, tick=1500),
+            replace(in_range, timestamp=t0 + timedelta(minutes=10)),
+            replace(out_of_range, timestamp=t0 + timedelta(minutes=50)),
+        ]
+    )
+    rebalancer = OutOfRangeDurationRebalancer(
+        duration=timedelta(minutes=30), out_of_range_since=t0 + timedelta(minutes=100)
+    )
+
+    result = GlobalClockBacktestRunner(
+        contexts=[make_simulation(position, series, rebalancer)]
+    ).run().results[0]
+
+    assert [e.timestamp for e in result.rebalancing_events] == [t0 + timedelta(minutes=50)]
+
+
+def test_duck_typed_rebalancer_is_checked_on_every_swap(position, swap_series):
+    class CountingRebalancer:
+        def __init__(self):
+            self.checked = 0
+
+        def should_rebalance(self, context):
+            self.checked += 1
+            return False
+
+        def rebalance(self, context):
+            raise AssertionError("should not rebalance")
+
+        def get_event_at(self, timestamp):
+            return None
+
+    rebalancer = CountingRebalancer()
+    context = make_simulation(position, swap_series, rebalancer)
+
+    GlobalClockBacktestRunner(contexts=[context]).run()
+
+    assert rebalancer.checked == len(swap_series.swaps)
@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from uniswap_v3_backtester.algo.compounder import Compounder, CompounderContext
+from uniswap_v3_backtester.algo.fees import Fee
+
+now = datetime.now()
+
+
+def make_context(timestamp: datetime, token0: str, token1: str) -> CompounderContext:
+    return CompounderContext(
+        timestamp=timestamp,
+        created_at=now,
+        accumulated_fees=Fee(token0=Decimal(token0), token1=Decimal(token1)),
+    )
+
+
+def test_get_event_at(position):
+    compounder = Compounder(interval=timedelta(minutes=1))
+    ts1, ts2 = now, now + timedelta(minutes=5)
+    for ctx in (make_context(ts1, "1", "2"), make_context(ts2, "3", "4")):
+        compounder.compound(position, ctx.accumulated_fees, ctx)
+
+    assert compounder.get_event_at(ts1).added_token0 == Decimal("1")
+    assert compounder.get_event_at(ts2).added_token1 == Decimal("4")
+    assert compounder.get_event_at(now + timedelta(minutes=1)) is None
+
+
+def test_total_compounded_fees(position):
+    compounder = Compounder(interval=timedelta(minutes=1))
+    assert compounder.get_total_compounded_fees() == Fee(token0=Decimal(0), token1=Decimal(0))
+
+    for minutes, token0, token1 in [(0, "1.5", "2"), (5, "0.5", "3")]:
+        ctx = make_context(now + timedelta(minutes=minutes), token0, token1)
+        compounder.compound(position, ctx.accumulated_fees, ctx)
+
+    total = compounder.get_total_compounded_fees()
+    assert total.token0 == Decimal("2.0")
+    assert total.token1 == Decimal("5")
@@ -1,6 +1,10 @@
+from dataclasses import replace
 from datetime import datetime
 from decimal import Decimal
 
+import numpy as np
+import pytest
+
 from uniswap_v3_backtester.algo.fees import FeeCalculator
 from uniswap_v3_backtester.algo.pool import Position, Swap, SwapSeries
 
@@ -58,6 +62,41 @@ def test_track_fee_timeseries_empty(position):
     assert result.fees == []
     assert result.timestamps == []
 
+
+def test_track_batch_matches_track(position, swap_series):
+    first, second, third = swap_series.swaps
+    swap_series = SwapSeries(
+        swaps=[
+            replace(first, volume_token1=Decimal("-200")),
+            replace(second, volume_token0=Decimal("-150")),
+            third,
+        ]
+    )
+    is_active = [True, True, False]
+
+    looped = FeeCalculator(position=position)
+    for swap, active in zip(swap_series.swaps, is_active):
+        looped.track(swap, is_active=active)
+
+    batched = FeeCalculator(position=position)
+    arrays = swap_series.to_arrays()
+    batched.track_batch(
+        swap_series.timestamps,
+        arrays["volumes0"],
+        arrays["volumes1"],
+        arrays["liquidity"],
+        np.array(is_active),
+    )
+
+    looped_fees = looped.get_timeseries().fees
+    batched_fees = batched.get_timeseries().fees
+    assert [f.token0 for f in batched_fees] == pytest.approx([f.token0 for f in looped_fees])
+    assert [f.token1 for f in batched_fees] == pytest.approx([f.token1 for f in looped_fees])
+    assert batched.get_total_fees().token0 == pytest.approx(looped.get_total_fees().token0)
+    assert batched.get_total_fees().token1 == pytest.approx(looped.get_total_fees().token1)
+    assert batched.get_total_fees().token0 > 0
+    assert batched.get_total_fees().token1 > 0
+
 def test_fee_not_collected_when_becomes_inactive_after_rebalance(position):
     calc = FeeCalculator(position=position)
     swap = make_test_swap(1500)
@@ -80,3 +119,39 @@ def test_fee_not_collected_when_still_inactive_after_rebalance(position):
     total = calc.get_total_fees()
     assert total.token0 == 0
     assert total.token1 == 0
+
+
+def test_reset_uses_updated_position_liquidity(position):
+    calc = FeeCalculator(position=position)
+    swap = Swap(
+        tick=1500,
+        volume_token0=Decimal("100"),
+        volume_token1=Decimal("-200"),
+        liquidity=Decimal("10000"),
+        sqrt_price_x96=10000,
+        timestamp=datetime.now(),
+    )
+
+    position.liquidity = position.liquidity * 2
+    calc.reset()
+    calc.track(swap, is_active=True)
+    expected = calc.compute_fee_for_swap(swap)
+    assert float(calc.get_total_fees().token0) == pytest.approx(float(expected.token0))
+
+
+def test_track_series_matches_track(position, swap_series):
+    first, second, third = swap_series.swaps
+    swap_series = SwapSeries(
+        swaps=[first, replace(second, volume_token1=Decimal("-200")), third]
+    )
+
+    looped = FeeCalculator(position=position)
+    for swap in swap_series.swaps:
+        looped.track(swap, is_active=position.tick_lower <= swap.tick <= position.tick_upper)
+
+    batched = FeeCalculator(position=position)
+    batched.track_series(swap_series)
+
+    assert batched.get_total_fees().token0 == pytest.approx(looped.get_total_fees().token0)
+    assert batched.get_total_fees().token1 == pytest.approx(looped.get_total_fees().token1)
+    assert batched.get_total_fees().token0 > 0
@@ -0,0 +1,122 @@
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from uniswap_v3_backtester.algo import _fast
+from uniswap_v3_backtester.algo._kernels import (
+    compute_activity,
+    compute_fees,
+    compute_il_batch,
+    compute_token_amounts,
+    run_vectorized,
+)
+from uniswap_v3_backtester.algo.math import (
+    MAX_TICK,
+    MIN_TICK,
+    compute_impermanent_loss,
+    compute_realized_il,
+    sqrtPriceX96_to_price_adjusted,
+    tick_to_sqrt_price,
+)
+from uniswap_v3_backtester.algo.pool import SwapSeries
+
+
+@pytest.mark.parametrize("tick", [MIN_TICK, -1000, 0, 1, 1500, MAX_TICK])
+def test_tick_to_sqrt_price_matches_pow(tick):
+    assert tick_to_sqrt_price(tick) == pytest.approx(1.0001 ** (tick / 2), rel=1e-12)
+
+
+@pytest.mark.parametrize("tick", [MIN_TICK - 1, MAX_TICK + 1])
+def test_tick_to_sqrt_price_out_of_bounds(tick):
+    with pytest.raises(ValueError):
+        tick_to_sqrt_price(tick)
+
+
+@pytest.mark.parametrize("current_tick", [1000, 1250, 1500, 1999, 2000])
+def test_fast_impermanent_loss_matches_decimal(current_tick):
+    expected = compute_impermanent_loss(current_tick, 1500, 1000, 2000)
+    actual = _fast.compute_impermanent_loss(current_tick, 1500, 1000, 2000)
+    assert actual == pytest.approx(float(expected), rel=1e-12, abs=1e-12)
+
+
+def test_fast_realized_il_matches_decimal():
+    expected = compute_realized_il(
+        Decimal("0.5"), Decimal("0.2"), Decimal("0.4"), Decimal("-1.5")
+    )
+    actual = _fast.compute_realized_il(0.5, 0.2, 0.4, -1.5)
+    assert actual == pytest.approx(float(expected))
+
+
+def test_il_batch_matches_scalar():
+    ticks = np.array([1000, 1250, 1500, 1999, 2000])
+    expected = [_fast.compute_impermanent_loss(int(t), 1500, 1000, 2000) for t in ticks]
+    assert compute_il_batch(ticks, 1500, 1000, 2000).tolist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "sqrt_price_x96, token0_decimals, token1_decimals, expected",
+    [
+        (2**96, 18, 18, Decimal(1)),
+        (2**95, 18, 18, Decimal("0.25")),
+        (2**97, 8, 18, Decimal("4e-10")),
+        (2**96, 18, 6, Decimal("1e12")),
+    ],
+)
+def test_sqrt_price_x96_to_price_adjusted(
+    sqrt_price_x96, token0_decimals, token1_decimals, expected
+):
+    price = sqrtPriceX96_to_price_adjusted(
+        sqrt_price_x96, token0_decimals, token1_decimals
+    )
+    assert price == expected
+
+
+def test_run_vectorized_matches_individual_kernels(swap_series):
+    arrays = swap_series.to_arrays()
+    arrays["volumes1"] = arrays["volumes1"].copy()
+    arrays["volumes1"][0] = -200.0
+    ticks = arrays["ticks"]
+
+    result = run_vectorized(arrays, 1000, 2000, 1e6, 0.003, il_range=(1500, 1000, 2000))
+
+    active = compute_activity(ticks, 1000, 2000)
+    amount0, amount1 = compute_token_amounts(ticks, 1000, 2000, 1e6)
+    fee0, fee1 = compute_fees(
+        arrays["volumes0"], arrays["volumes1"], arrays["liquidity"], 1e6, 0.003, active
+    )
+    assert result.is_active.tolist() == active.tolist()
+    assert result.amount0.tolist() == amount0.tolist()
+    assert result.amount1.tolist() == amount1.tolist()
+    assert result.fee0.tolist() == fee0.tolist()
+    assert result.fee1.tolist() == fee1.tolist()
+    assert (
+        result.il.tolist()
+        == compute_il_batch(np.clip(ticks, 1000, 2000), 1500, 1000, 2000).tolist()
+    )
+
+
+def test_swap_series_views_are_cached(swap_series):
+    assert swap_series.timestamps is swap_series.timestamps
+    assert swap_series.ticks == [s.tick for s in swap_series.swaps]
+    assert swap_series.to_arrays()["ticks"] is swap_series.to_arrays()["ticks"]
+
+
+def test_swap_series_cache_does_not_affect_equality(swap_series):
+    other = SwapSeries(swaps=list(swap_series.swaps))
+    swap_series.to_arrays()
+    assert swap_series == other
+    other.to_arrays()
+    assert swap_series == other
+    with pytest.raises(ValueError):
+        swap_series.to_arrays()["ticks"][0] = 0
+
+
+def test_swap_series_cannot_change_under_its_cache(swap_series):
+    assert swap_series.to_arrays()["ticks"].tolist() == swap_series.ticks
+    with pytest.raises(FrozenInstanceError):
+        swap_series.swaps[0].tick = 0
+    with pytest.raises(AttributeError):
+        swap_series.swaps.append(swap_series.swaps[0])
+    assert swap_series.to_arrays()["ticks"].tolist() == [s.tick for s in swap_series.swaps]
@@ -0,0 +1,36 @@
+import pytest
+
+from uniswap_v3_backtester.algo.activity import ActivityTracker
+
+
+def test_position_rejects_inverted_bounds(position):
+    with pytest.raises(ValueError):
+        position.tick_lower = 2500
+    with pytest.raises(ValueError):
+        position.tick_upper = 500
+    with pytest.raises(ValueError):
+        position.set_bounds(1600, 1400)
+
+
+def test_set_bounds_moves_range_past_old_upper(position):
+    tracker = ActivityTracker(position=position)
+    position.set_bounds(2500, 3500)
+    assert tracker.is_active(3000)
+    assert not tracker.is_active(2000)
+
+
+def test_position_width_follows_bounds(position):
+    assert position.width == position.tick_upper - position.tick_lower
+    position.tick_upper = 2500
+    assert position.width == 2500 - position.tick_lower
+    position.set_bounds(100, 400)
+    assert position.width == 300
+
+
+def test_position_copy_refreshes_bounds(position):
+    copy = position.model_copy(update={"tick_upper": 500, "tick_lower": 100})
+    assert copy.width == 400
+    assert copy.sqrt_price_upper == pytest.approx(1.0001**250)
+    assert position.width == 1000
+    with pytest.raises(ValueError):
+        position.model_copy(update={"tick_upper": 500})
@@ -1,12 +1,15 @@
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 from uniswap_v3_backtester.algo.rebalancer import (
+    BaseRebalancer,
     LogicMode,
     MultiConditionRebalancer,
     OutOfRangeDurationRebalancer,
     OutOfRangeRebalancer,
+    RebalanceEvent,
     RebalancerContext,
     RebalancingStrategy,
     TimeTriggeredRebalancer,
@@ -34,16 +37,30 @@ def test_tick_range_with_bias():
 
 
 def test_bias_validation_failure():
-    strat = TimeTriggeredRebalancer(interval=timedelta(minutes=1))
-    ctx = make_context(1500, now, 1400, 1600)
     with pytest.raises(ValueError):
-        strat.rebalance(ctx, -0.1)
+        TimeTriggeredRebalancer(interval=timedelta(minutes=1), bias=-0.1)
     with pytest.raises(ValueError):
-        strat.rebalance(ctx, 1.1)
+        TimeTriggeredRebalancer(interval=timedelta(minutes=1), bias=1.1)
+
+
+def test_rebalance_uses_strategy_bias():
+    strat = OutOfRangeRebalancer(bias=0.25)
+    new_lower, new_upper = strat.rebalance(make_context(1500, now, 1450, 1550))
+    assert (new_lower, new_upper) == compute_tick_range(1500, 100, bias=0.25)
+
+
+def test_multi_condition_uses_child_bias():
+    strat = MultiConditionRebalancer(
+        strategies=[OutOfRangeRebalancer(bias=0.25)], mode=LogicMode.OR
+    )
+    new_lower, new_upper = strat.rebalance(make_context(1600, now, 1450, 1550))
+    assert (new_lower, new_upper) == compute_tick_range(1600, 100, bias=0.25)
+    with pytest.raises(TypeError):
+        MultiConditionRebalancer(strategies=[], mode=LogicMode.OR, bias=0.25)
 
 
 def test_base_strategy_interface():
-    class DummyStrategy(RebalancingStrategy):
+    class DummyStrategy(BaseRebalancer):
         pass
 
     strat = DummyStrategy()
@@ -51,7 +68,7 @@ def test_base_strategy_interface():
     with pytest.raises(NotImplementedError):
         strat.should_rebalance(ctx)
     with pytest.raises(NotImplementedError):
-        strat.rebalance(ctx, 0.5)
+        strat.rebalance(ctx)
 
 
 def test_time_triggered_rebalance(position):
@@ -65,7 +82,7 @@ def test_time_triggered_rebalance(position):
     ctx2 = make_context(1500, ts2, lower, upper)
 
     assert not strat.should_rebalance(ctx1)
-    strat.rebalance(ctx1, 0.5)
+    strat.rebalance(ctx1)
     assert not strat.should_rebalance(
         make_context(1500, ts1 + timedelta(minutes=1), lower, upper)
     )
@@ -80,7 +97,7 @@ def test_out_of_range_rebalancer(position):
     assert not strat.should_rebalance(make_context(1500, now, lower, upper))
     assert strat.should_rebalance(make_context(2100, now, lower, upper))
 
-    new_lower, new_upper = strat.rebalance(make_context(2100, now, lower, upper), 0.5)
+    new_lower, new_upper = strat.rebalance(make_context(2100, now, lower, upper))
     assert new_lower != lower and new_upper != upper
 
 
@@ -116,7 +133,7 @@ def test_multi_condition_and_mode(position):
         mode=LogicMode.AND,
     )
     ctx_rebalance = make_context(950, now, position.tick_lower, position.tick_upper)
-    ttr.rebalance(ctx_rebalance, 0.5)
+    ttr.rebalance(ctx_rebalance)
 
     ctx_check = make_context(
         1500, now + timedelta(seconds=1), position.tick_lower, position.tick_upper
@@ -132,7 +149,7 @@ def test_time_triggered_negative_interval():
 def test_time_triggered_exact_same_timestamp(position):
     strat = TimeTriggeredRebalancer(interval=timedelta(seconds=60))
     ctx = make_context(1500, now, position.tick_lower, position.tick_upper)
-    strat.rebalance(ctx, 0.5)
+    strat.rebalance(ctx)
     assert not strat.should_rebalance(ctx)
 
 
@@ -173,3 +190,157 @@ def test_multi_condition_empty_strategy_list(position):
     strat = MultiConditionRebalancer(strategies=[], mode=LogicMode.OR)
     ctx = make_context(1500, now, position.tick_lower, position.tick_upper)
     assert not strat.should_rebalance(ctx)
+
+
+def test_get_event_at(position):
+    strat = OutOfRangeRebalancer()
+    ts = now + timedelta(seconds=5)
+    strat.rebalance(make_context(2100, ts, position.tick_lower, position.tick_upper))
+
+    event = strat.get_event_at(ts)
+    assert event is not None and event.rebalance_tick == 2100
+    assert strat.get_event_at(now) is None
+    assert MultiConditionRebalancer(strategies=[strat], mode=LogicMode.OR).get_event_at(ts) == event
+
+
+def test_events_are_per_instance_and_grow(position):
+    strat = OutOfRangeRebalancer()
+    other = OutOfRangeRebalancer()
+    lower, upper = position.tick_lower, position.tick_upper
+    for i in range(20):
+        strat.rebalance(make_context(2100 + i, now + timedelta(seconds=i), lower, upper))
+
+    assert [e.rebalance_tick for e in strat.events] == list(range(2100, 2120))
+    assert strat.get_event_at(now + timedelta(seconds=19)).rebalance_tick == 2119
+    assert other.events == []
+
+
+def test_multi_condition_short_circuits(position):
+    class FailingStrategy(RebalancingStrategy):
+        def should_rebalance(self, context):
+            raise AssertionError("should not be evaluated")
+
+    in_range = make_context(1500, now, position.tick_lower, position.tick_upper)
+    out_of_range = make_context(950, now, position.tick_lower, position.tick_upper)
+    and_strat = MultiConditionRebalancer(
+        strategies=[OutOfRangeRebalancer(), FailingStrategy()], mode=LogicMode.AND
+    )
+    or_strat = MultiConditionRebalancer(
+        strategies=[OutOfRangeRebalancer(), FailingStrategy()], mode=LogicMode.OR
+    )
+    assert not and_strat.should_rebalance(in_range)
+    assert or_strat.should_rebalance(out_of_range)
+
+
+def test_multi_condition_still_resets_skipped_duration(position):
+    duration = OutOfRangeDurationRebalancer(
+        duration=timedelta(minutes=30), out_of_range_since=now - timedelta(hours=1)
+    )
+    strat = MultiConditionRebalancer(
+        strategies=[OutOfRangeRebalancer(), duration], mode=LogicMode.AND
+    )
+    lower, upper = position.tick_lower, position.tick_upper
+
+    assert not strat.should_rebalance(make_context(1500, now, lower, upper))
+    assert duration.out_of_range_since is None
+
+
+@pytest.mark.parametrize(
+    "bias", [0.0, 0.1, 0.2, 0.25, 0.3, 0.4, 0.5, 0.6, 0.7, 0.75, 0.9, 1.0]
+)
+@pytest.mark.parametrize("width", [0, 1, 7, 100, 600, 12345])
+def test_strategy_tick_range_matches_compute_tick_range(bias, width):
+    strat = OutOfRangeRebalancer(bias=bias)
+    new_lower, new_upper = strat.rebalance(make_context(2100, now, 1000, 1000 + width))
+    assert (new_lower, new_upper) == compute_tick_range(2100, width, bias)
+
+
+@pytest.mark.parametrize(
+    "strat",
+    [
+        OutOfRangeRebalancer(),
+        OutOfRangeDurationRebalancer(duration=timedelta(seconds=30)),
+        TimeTriggeredRebalancer(interval=timedelta(seconds=45)),
+        MultiConditionRebalancer(
+            strategies=[
+                OutOfRangeRebalancer(),
+                TimeTriggeredRebalancer(interval=timedelta(seconds=20)),
+            ],
+            mode=LogicMode.AND,
+        ),
+    ],
+)
+def test_vectorized_triggers_match_should_rebalance(strat):
+    ticks = [950, 1500, 2100, 2000, 980, 3000, 1000, 900]
+    timestamps = [now + timedelta(seconds=10 * k) for k in range(len(ticks))]
+
+    mask = strat.vectorized_triggers(
+        np.array(ticks), np.array(timestamps, dtype="datetime64[ns]"), 1000, 2000, now
+    )
+
+    expected = [
+        strat.should_rebalance(make_context(tick, ts, 1000, 2000))
+        for tick, ts in zip(ticks, timestamps)
+    ]
+    assert mask.tolist() == expected
+
+
+def test_multi_condition_merged_event_index(position):
+    first, second = OutOfRangeRebalancer(), OutOfRangeRebalancer()
+    strat = MultiConditionRebalancer(strategies=[first, second], mode=LogicMode.OR)
+    lower, upper = position.tick_lower, position.tick_upper
+    t1, t2, t3 = (now + timedelta(seconds=k) for k in (1, 2, 3))
+
+    second.rebalance(make_context(2200, t2, lower, upper))
+    assert strat.get_event_at(t2).rebalance_tick == 2200
+
+    first.rebalance(make_context(2300, t3, lower, upper))
+    first.rebalance(make_context(2100, t1, lower, upper))
+    second.rebalance(make_context(2400, t3, lower, upper))
+
+    assert [e.rebalance_tick for e in strat.events] == [2100, 2200, 2300, 2400]
+    assert strat.get_event_at(t1).rebalance_tick == 2100
+    # On equal timestamps the earlier strategy's event is reported
+    assert strat.get_event_at(t3).rebalance_tick == 2300
+    assert strat.get_event_at(now) is None
+
+
+def test_multi_condition_event_lookup_with_duck_typed_child(position):
+    class DuckRebalancer:
+        def __init__(self):
+            self.events = []
+
+        def should_rebalance(self, context):
+            return False
+
+        def rebalance(self, context):
+            raise AssertionError("should not rebalance")
+
+        def get_event_at(self, timestamp):
+            return next((e for e in self.events if e.timestamp == timestamp), None)
+
+    duck = DuckRebalancer()
+    duck.events.append(
+        RebalanceEvent(timestamp=now, rebalance_tick=1, new_tick_lower=0, new_tick_upper=2)
+    )
+    inner = MultiConditionRebalancer(strategies=[duck], mode=LogicMode.OR)
+    strat = MultiConditionRebalancer(
+        strategies=[inner, OutOfRangeRebalancer()], mode=LogicMode.OR
+    )
+    later = now + timedelta(seconds=1)
+
+    assert strat.rebalance(make_context(2100, later, position.tick_lower, position.tick_upper))
+    assert strat.get_event_at(later).rebalance_tick == 2100
+    assert strat.get_event_at(now).rebalance_tick == 1
+    assert strat.get_event_at(now + timedelta(seconds=2)) is None
+
+
+def test_strategies_are_slotted_protocol_implementations():
+    strat = MultiConditionRebalancer(
+        strategies=[OutOfRangeRebalancer()], mode="and"
+    )
+    assert isinstance(strat, RebalancingStrategy)
+    assert strat.mode is LogicMode.AND
+    assert not hasattr(strat, "__dict__")
+    with pytest.raises(ValueError):
+        MultiConditionRebalancer(strategies=[], mode="xor")